@@ -2,24 +2,69 @@
 from __future__ import annotations
 import csv
 import math
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
-# Try rich import; graceful fallback to plain prints if unavailable
-try:
-    from rich.console import Console
-    from rich.table import Table
+if TYPE_CHECKING:
+    from rich.console import Console, Group
     from rich.panel import Panel
-    from rich.box import ROUNDED
-    from rich.text import Text
-    from rich.bar import Bar
-    from rich.rule import Rule
-    from rich import box
-    from rich.columns import Columns
-    from rich.padding import Padding
-    from rich.align import Align
+    from rich.style import Style
+
+# rich est importé au premier affichage (cf. `_load_rich`) : importer ce module,
+# ou lancer `--help`, ne paie pas le coût de chargement de rich.
+# None = pas encore résolu ; True/False ensuite.
+_HAS_RICH = None
+
+# Styles des segments des graphes horaires, résolus une seule fois par `_load_rich`.
+# Sans Rich, un marqueur texte suffit (seul son caractère non vide est utilisé).
+_STYLE_PV_DIRECT   = "[orange1]"   # PV direct
+_STYLE_BATT_LOAD   = "[magenta]"   # Batterie → charges
+_STYLE_IMPORT      = "[blue]"      # Import réseau
+_STYLE_GRID_BATT   = "[#00BFFF]"   # Réseau → batterie
+_STYLE_PV_BATT     = "[yellow3]"   # PV → batterie
+_STYLE_EXPORT      = "[grey74]"    # Export
+
+def _load_rich() -> bool:
+    """ Importe rich (une seule fois) et publie ses classes dans les globales du module.
+    Graceful fallback : sans rich, les affichages restent en texte brut.
+
+    Returns:
+        bool: True si rich est disponible
+    """
+    global _HAS_RICH
+    if _HAS_RICH is not None:
+        return _HAS_RICH
+    try:
+        from rich.console import Console, Group
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich.box import ROUNDED
+        from rich.text import Text
+        from rich.bar import Bar
+        from rich.rule import Rule
+        from rich import box
+        from rich.columns import Columns
+        from rich.padding import Padding
+        from rich.align import Align
+        from rich.style import Style
+    except Exception:
+        _HAS_RICH = False
+        return _HAS_RICH
+    g = globals()
+    g.update(Console=Console, Group=Group, Table=Table, Panel=Panel, ROUNDED=ROUNDED,
+             Text=Text, Bar=Bar, Rule=Rule, box=box, Columns=Columns, Padding=Padding,
+             Align=Align, Style=Style)
+    # styles des segments : parsés une seule fois
+    for name in ("_STYLE_PV_DIRECT", "_STYLE_BATT_LOAD", "_STYLE_IMPORT",
+                 "_STYLE_GRID_BATT", "_STYLE_PV_BATT", "_STYLE_EXPORT"):
+        g[name] = Style.parse(g[name][1:-1])
     _HAS_RICH = True
-except Exception:
-    _HAS_RICH = False
+    return _HAS_RICH
 
 class ConsoleUI:
     """ Console output handler with optional rich formatting.
@@ -42,25 +87,47 @@ class ConsoleUI:
     16) Daily sum calculation
     """
 
+    # largeur de l'axe Y dans les graphes : len(f"{0:>4.1f}│") == 5
+    AXIS_PAD = 5
+    # nombre max d'entrées gardées dans le cache des totaux/métriques journaliers
+    TOTALS_CACHE_SIZE = 64
+    # nombre max de fichiers gardés dans les caches d'en-tête, de délimiteur et de jours
+    FILE_CACHE_SIZE = 16
+
     def __init__(self):
-        """ Initializes the ConsoleUI, checking for rich library availability.
+        """ Initializes the ConsoleUI; rich availability is resolved on first output.
         """
-        self.has_rich = _HAS_RICH
-        self.console = Console() if self.has_rich else None
+        # résolus à la demande (cf. propriétés `has_rich` / `console`)
+        self._has_rich: bool | None = None
+        self._console = None
+        # positions des colonnes par fichier CSV : {(chemin, mtime_ns, taille): {nom: index}}
+        self._header_cache: dict[tuple[str, int, int], dict[str, int]] = {}
+        # délimiteur détecté par fichier CSV : {(chemin, mtime_ns, taille): délimiteur}
+        self._delim_cache: dict[tuple[str, int, int], str] = {}
+        # jours présents par fichier CSV : {(chemin, mtime_ns, taille): (jours triés, ensemble des jours)}
+        self._dates_cache: dict[tuple[str, int, int], tuple[list[str], set[str]]] = {}
+        # totaux/métriques par (chemin, mtime_ns, taille, jour, nb jours, type) : réutilisés d'un tracé à l'autre
+        self._totals_cache: dict[tuple, object] = {}
+
+    @property
+    def has_rich(self) -> bool:
+        """ True si rich est disponible (import au premier accès). """
+        if self._has_rich is None:
+            self._has_rich = _load_rich()
+        return self._has_rich
+
+    @has_rich.setter
+    def has_rich(self, value: bool) -> None:
+        self._has_rich = value
+
+    @property
+    def console(self) -> Console | None:
+        """ Console rich, créée au premier accès (None sans rich). """
+        if self._console is None and self.has_rich:
+            self._console = Console()
+        return self._console
 
     # ---------- helpers ----------
-    def _fmt_kwh(self,
-                 v: float,
-                 ) -> str:
-        """ 
-        Formats a float value as kWh with no decimal places.
-        Args:
-            v (float): value in kWh
-        Returns:
-            str: formatted string
-        """
-        return f"{v:.0f}"
-
     def _fmt_pct(self,
                  v: float,
                  ) -> str:
@@ -138,35 +205,35 @@ class ConsoleUI:
                 table.add_row(
                     f"{pv_factor:g}",
                     f"{batt_kw} kW",
-                    self._fmt_kwh(pv),
-                    self._fmt_kwh(load),
-                    self._fmt_kwh(imp),
-                    self._fmt_kwh(exp),
+                    f"{pv:.0f}",
+                    f"{load:.0f}",
+                    f"{imp:.0f}",
+                    f"{exp:.0f}",
                     self._fmt_pct(ac),
                     self._fmt_pct(tc),
                 )
             else:
                 table.add_row(
-                    self._fmt_kwh(pv),
-                    self._fmt_kwh(load),
-                    self._fmt_kwh(imp),
-                    self._fmt_kwh(exp),
+                    f"{pv:.0f}",
+                    f"{load:.0f}",
+                    f"{imp:.0f}",
+                    f"{exp:.0f}",
                     self._fmt_pct(ac),
                     self._fmt_pct(tc),
                 )
-            self.console.print(table)
-
+            out = [table]
             # Affichage de la puissance installée si dispo
             if pv_kw:
-                self.console.print(f"[cyan]Installation PV présente: {pv_kw:.1f} kWc[/cyan]")
+                out.append(self.console.render_str(f"[cyan]Installation PV présente: {pv_kw:.1f} kWc[/cyan]"))
+            # un seul rendu pour le tableau et la ligne d'info
+            self.console.print(Group(*out))
+            print(" ")
         else:
-            if start and end:
-                print(f"Situation actuelle ({start[:10]} → {end[:10]})")
-            else:
-                print(f"{title}")
-            print(f"PV={pv:.0f} kWh, Load={load:.0f} kWh, Import={imp:.0f} kWh, Export={exp:.0f} kWh, "
-                  f"AC={ac:.1f} %, TC={tc:.1f} %")
-        print(" ")
+            lines = [f"Situation actuelle ({start[:10]} → {end[:10]})" if start and end else f"{title}",
+                     f"PV={pv:.0f} kWh, Load={load:.0f} kWh, Import={imp:.0f} kWh, Export={exp:.0f} kWh, "
+                     f"AC={ac:.1f} %, TC={tc:.1f} %",
+                     " "]
+            self._print_lines(lines)
 
     def passing(self,
                 passing: list[tuple[float, float, dict]],
@@ -200,7 +267,6 @@ class ConsoleUI:
         hdr = (f"Scénarios valides: AC ∈ [{target_ac_min:.0f} → {target_ac_max:.0f}] %, "
                f"TC ≥ {target_tc_min:.0f} %")
         if self.has_rich:
-            self.console.print(Panel.fit(hdr, border_style="green", title="Résultats"))
             table = Table(show_lines=True, box=ROUNDED, border_style="white")
             table.add_column("PV ×", justify="center")
             table.add_column("Batterie", justify="right")
@@ -214,22 +280,24 @@ class ConsoleUI:
                 table.add_row(
                     f"{fct:g}",
                     f"{int(b)} kWh",
-                    self._fmt_kwh(st["pv_tot"]),
-                    self._fmt_kwh(st["load_tot"]),
-                    self._fmt_kwh(st["import_tot"]),
-                    self._fmt_kwh(st["export_tot"]),
+                    f"{st['pv_tot']:.0f}",
+                    f"{st['load_tot']:.0f}",
+                    f"{st['import_tot']:.0f}",
+                    f"{st['export_tot']:.0f}",
                     self._fmt_pct(st["ac"]),
                     self._fmt_pct(st["tc"]),
                 )
-            self.console.print(table)
+            # en-tête et tableau rendus en un seul appel
+            self.console.print(Group(Panel.fit(hdr, border_style="green", title="Résultats"), table))
         else:
-            print("\n[Résultats] " + hdr)
-            print(" PV× | Batt(kWh) |   PV  | Load | Imp | Exp |  AC% |  TC% ")
-            print("-----+-----------+-------+------+-----+-----+------+------")
-            for fct, b, st in passing[:limit]:
-                print(f"{fct:>4g} | {int(b):>9} | {st['pv_tot']:>5.0f} | {st['load_tot']:>4.0f} | "
-                      f"{st['import_tot']:>3.0f} | {st['export_tot']:>3.0f} | "
-                      f"{st['ac']:>5.1f} | {st['tc']:>5.1f}")
+            lines = ["\n[Résultats] " + hdr,
+                     " PV× | Batt(kWh) |   PV  | Load | Imp | Exp |  AC% |  TC% ",
+                     "-----+-----------+-------+------+-----+-----+------+------"]
+            lines.extend(f"{fct:>4g} | {int(b):>9} | {st['pv_tot']:>5.0f} | {st['load_tot']:>4.0f} | "
+                         f"{st['import_tot']:>3.0f} | {st['export_tot']:>3.0f} | "
+                         f"{st['ac']:>5.1f} | {st['tc']:>5.1f}"
+                         for fct, b, st in passing[:limit])
+            self._print_lines(lines)
 
     def best(self,
              best_tuple: tuple,
@@ -506,14 +574,21 @@ class ConsoleUI:
                     path: str,
                     ) -> str:
         """ Détecte automatiquement le délimiteur CSV (virgule ou point-virgule) en lisant la première ligne.
+        Le résultat est mis en cache par version du fichier (cf. _file_key) : un même fichier n'est lu qu'une fois.
         Args:
             path (str): chemin du fichier CSV
         Returns:
             str: délimiteur détecté ("," ou ";")
         """
+        key = self._file_key(path)
+        if key is not None and key in self._delim_cache:
+            return self._delim_cache[key]
         with open(path, "r", newline="") as f:
-            head = f.readline()
-            return ";" if head.count(";") > head.count(",") else ","
+            head = f.readline(8192)  # l'en-tête suffit : au plus 8 Ko
+        delim = ";" if head.count(";") > head.count(",") else ","
+        if key is not None:
+            self._cache_put(self._delim_cache, key, delim, self.FILE_CACHE_SIZE)
+        return delim
 
     def _as_float(self,
                   x,
@@ -558,118 +633,199 @@ class ConsoleUI:
             except Exception:
                 return -1
 
-    def _read_day_rows(self,
-                       csv_path: str,
-                       day: str,
-                       report: bool = False,
-                       ):
+    def _file_key(self,
+                  path: str,
+                  ) -> tuple[str, int, int] | None:
+        """
+        Clé de cache d'un fichier : (chemin, mtime_ns, taille), ou None si le fichier est inaccessible.
+        Même invalidation que energy_tool._DAYS_CACHE : un fichier réécrit dans le même tick
+        de mtime change en général de taille.
+        Args:
+            path (str): chemin du fichier
+        Returns:
+            tuple | None: (chemin, mtime_ns, taille) ou None
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (path, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _cache_put(cache: dict,
+                   key,
+                   value,
+                   maxsize: int,
+                   ) -> None:
         """
-        Lecture du fichier CSV en entrée pour en sortir un dictionnaire
-        des 24 heures d'une journée donnée.
+        Insère dans un cache borné : au-delà de `maxsize` entrées, la plus ancienne est évincée.
+        Args:
+            cache (dict): cache à compléter (ordre d'insertion = ancienneté)
+            key: clé
+            value: valeur
+            maxsize (int): nombre max d'entrées
+        """
+        if key not in cache and len(cache) >= maxsize:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+    def _header_index(self,
+                      csv_path: str,
+                      header: list,
+                      ) -> dict:
+        """
+        Positions des colonnes du CSV, mises en cache par version du fichier (cf. _file_key).
         Args:
             csv_path (str): chemin du fichier CSV
-            day (str): jour au format "YYYY-MM-DD"
-            report (bool, optional): si True, on s'attend à un CSV de type
-                                     "report" (ex: exporté de PVOutput).
-                                     Si False, on s'attend à un CSV de type
-                                        "simu" (ex: exporté de la simu).
-                                        Defaults to False.
+            header (list): ligne d'en-tête lue par csv.reader
         Returns:
-            list of dict: liste de 24 dictionnaires, un par heure,
-                          avec les clés:
-                          "hour", "pv_direct", "pv_to_batt", "batt_to_load",
-                          "import", "export", "pv", "load"
-        1) Détection du délimiteur
-        2) Lecture du CSV
-        3) Filtrage sur le jour demandé
-        4) Extraction des colonnes selon le type de CSV
-        5) Reconstitution des totaux PV/Load si absents
-        6) Garantie d'avoir 24 heures (0-23) dans la sortie
-        7) Retour de la liste des dictionnaires
+            dict: {nom de colonne: index} (en cas de doublon, la dernière l'emporte,
+                  comme avec csv.DictReader)
         """
-        delim = self._auto_delim(csv_path)
-        rows = []
-        
-        with open(csv_path, "r", newline="") as f:
-            rdr = csv.DictReader(f, delimiter=delim)
-            # Détection des colonnes dispo
-            for r in rdr:
-                ts = str(r.get("date",""))
-                if not ts.startswith(day):
-                    continue
-                h = self._hour_from(ts)
-                if h < 0: 
-                    continue
+        key = self._file_key(csv_path)
+        if key is None:
+            return {name: i for i, name in enumerate(header)}
+        idx = self._header_cache.get(key)
+        if idx is None:
+            idx = {name: i for i, name in enumerate(header)}
+            self._cache_put(self._header_cache, key, idx, self.FILE_CACHE_SIZE)
+        return idx
+
+    @staticmethod
+    def _col(row: list,
+             idx: dict,
+             key: str,
+             ) -> str | None:
+        """
+        Accès positionnel à une colonne d'une ligne csv.reader.
+        Args:
+            row (list): ligne brute du CSV
+            idx (dict): positions des colonnes (cf. _header_index)
+            key (str): nom de la colonne
+        Returns:
+            str | None: valeur brute, None si la colonne est absente
+        """
+        i = idx.get(key)
+        return row[i] if i is not None and i < len(row) else None
 
-                if not report:
-                    # ===== CSV SIMU =====
-                    pvd = self._as_float(r.get("pv_direct"))
-                    p2b = self._as_float(r.get("pv_to_batt"))
-                    b2l = self._as_float(r.get("batt_to_load"))
-                    g2b = self._as_float(r.get("grid_to_batt"))
-                    i2l = self._as_float(r.get("imp_to_load"))
-                    imp = self._as_float(r.get("import"))
-                    exp = self._as_float(r.get("export"))
-
-                    # Reconstitution PV/Load totaux si absents
-                    pv_total = self._as_float(r.get("pv"))
-                    if pv_total is None:
-                        pv_total = (pvd or 0.0) + (p2b or 0.0) + (exp or 0.0)
-                    load_total = self._as_float(r.get("load"))
-                    if load_total is None:
-                        load_total = (pvd or 0.0) + (b2l or 0.0) + (imp or 0.0)
-
-                    rows.append({
-                        "hour": h,
-                        "pv_direct":    pvd or 0.0,
-                        "pv_to_batt":   p2b or 0.0,
-                        "batt_to_load": b2l or 0.0,
-                        "grid_to_batt": g2b or 0.0,
-                        "imp_to_load":  i2l or 0.0,
-                        "import":       imp or 0.0,
-                        "export":       exp or 0.0,
-                        "pv":           pv_total or 0.0,
-                        "load":         load_total or 0.0,
-                    })
-                else:
-                    # ===== CSV REPORT (ou mix) =====
-                    # On veut voir PV et Load tels quels
-                    pv  = self._as_float(r.get("pv_diff"))
-                    if pv is None:
-                        pv = self._as_float(r.get("pv")) or 0.0
-                    load = self._as_float(r.get("load_diff"))
-                    if load is None:
-                        load = self._as_float(r.get("load")) or 0.0
-
-                    # Import/Export : utiliser colonnes si présentes, sinon calcul
-                    imp = self._as_float(r.get("import"))
-                    exp = self._as_float(r.get("export"))
-                    
-                    # production d'énergie consommée (autoconsommée)
-                    prod_cons = min(pv, load)
-
-                    if imp is None and exp is None:
-                        imp = max(load - pv, 0.0)
-                        exp = max(pv - load, 0.0)
-                    else:
-                        imp = imp or 0.0
-                        exp = exp or 0.0
-
-                    rows.append({
-                        "hour": h,
-                        # pas de batterie en 'actuel'
-                        "pv_direct":    0.0,
-                        "pv_to_batt":   0.0,
-                        "batt_to_load": 0.0,
-                        "grid_to_batt": 0.0,
-                        "imp_to_load":  0.0,
-                        "import":       imp,
-                        "export":       exp,
-                        "pv":           pv,
-                        "load":         load,
-                    })
-
-        # garantir 24h
+    @staticmethod
+    def _num(row: list,
+             i: int | None,
+             ) -> float:
+        """
+        Lecture numérique rapide d'une cellule csv.reader (0.0 si absente, vide ou invalide).
+        Args:
+            row (list): ligne brute du CSV
+            i (int | None): index de la colonne (None si la colonne n'existe pas)
+        Returns:
+            float: valeur convertie
+        """
+        if i is None or i >= len(row):
+            return 0.0
+        v = row[i]
+        if not v:
+            return 0.0
+        try:
+            return float(v)
+        except ValueError:
+            return 0.0
+
+    def _parse_hour_row_simu(self,
+                             r: list,
+                             idx: dict,
+                             h: int,
+                             ) -> dict:
+        """
+        Convertit une ligne brute d'un CSV "simu" (csv.reader) en dictionnaire horaire.
+        Args:
+            r (list): ligne brute du CSV
+            idx (dict): positions des colonnes (cf. _header_index)
+            h (int): heure (0-23) extraite de la date
+        Returns:
+            dict: dictionnaire avec les clés:
+                  "hour", "pv_direct", "pv_to_batt", "batt_to_load",
+                  "grid_to_batt", "imp_to_load", "import", "export", "pv", "load"
+        """
+        num, get = self._num, idx.get
+        # ===== CSV SIMU =====
+        pvd = num(r, get("pv_direct"))
+        p2b = num(r, get("pv_to_batt"))
+        b2l = num(r, get("batt_to_load"))
+        g2b = num(r, get("grid_to_batt"))
+        i2l = num(r, get("imp_to_load"))
+        imp = num(r, get("import"))
+        exp = num(r, get("export"))
+
+        # Reconstitution PV/Load totaux si colonnes absentes
+        pv_total = num(r, idx["pv"]) if "pv" in idx else pvd + p2b + exp
+        load_total = num(r, idx["load"]) if "load" in idx else pvd + b2l + imp
+
+        return {
+            "hour": h,
+            "pv_direct":    pvd or 0.0,
+            "pv_to_batt":   p2b or 0.0,
+            "batt_to_load": b2l or 0.0,
+            "grid_to_batt": g2b or 0.0,
+            "imp_to_load":  i2l or 0.0,
+            "import":       imp or 0.0,
+            "export":       exp or 0.0,
+            "pv":           pv_total or 0.0,
+            "load":         load_total or 0.0,
+        }
+
+    def _parse_hour_row_report(self,
+                               r: list,
+                               idx: dict,
+                               h: int,
+                               ) -> dict:
+        """
+        Convertit une ligne brute d'un CSV "report" (csv.reader) en dictionnaire horaire.
+        Args:
+            r (list): ligne brute du CSV
+            idx (dict): positions des colonnes (cf. _header_index)
+            h (int): heure (0-23) extraite de la date
+        Returns:
+            dict: mêmes clés que _parse_hour_row_simu (colonnes batterie à 0)
+        """
+        num, get = self._num, idx.get
+        # ===== CSV REPORT (ou mix) =====
+        # On veut voir PV et Load tels quels
+        pv   = num(r, get("pv_diff", get("pv")))
+        load = num(r, get("load_diff", get("load")))
+
+        # Import/Export : utiliser colonnes si présentes, sinon calcul
+        if "import" not in idx and "export" not in idx:
+            imp = max(load - pv, 0.0)
+            exp = max(pv - load, 0.0)
+        else:
+            imp = num(r, get("import")) or 0.0
+            exp = num(r, get("export")) or 0.0
+
+        return {
+            "hour": h,
+            # pas de batterie en 'actuel'
+            "pv_direct":    0.0,
+            "pv_to_batt":   0.0,
+            "batt_to_load": 0.0,
+            "grid_to_batt": 0.0,
+            "imp_to_load":  0.0,
+            "import":       imp,
+            "export":       exp,
+            "pv":           pv,
+            "load":         load,
+        }
+
+    def _fill_24h(self,
+                  rows: list,
+                  ) -> list:
+        """
+        Garantit 24 lignes (heures 0-23) triées, les heures manquantes étant remplies à 0.
+        Si plusieurs lignes ont la même heure, la dernière l'emporte.
+        Args:
+            rows (list): lignes horaires d'une journée (clé "hour")
+        Returns:
+            list: liste de 24 dictionnaires, un par heure
+        """
         by_h = {r["hour"]: r for r in rows}
         out = []
         for h in range(24):
@@ -687,6 +843,296 @@ class ConsoleUI:
         out.sort(key=lambda x: x["hour"])
         return out
 
+    def _meta_from_row(self,
+                       r: dict | None,
+                       scenario_default: str | None = None,
+                       ) -> dict:
+        """
+        Extrait les colonnes meta (paramètres de la simu) d'une ligne brute du CSV.
+        Args:
+            r (dict | None): ligne brute du CSV (première ligne du jour)
+            scenario_default (str, optional): scénario par défaut si la colonne est vide.
+        Returns:
+            dict: {"pv_factor", "batt_kwh", "eff", "initial_soc", "pv_kwc", "scenario"}
+                  ou {} si aucune ligne
+        """
+        if not r:
+            return {}
+
+        def _getf(key):
+            v = r.get(key)
+            try: return float(v) if v not in (None,"") else None
+            except: return v
+
+        return {
+            "pv_factor": _getf("pv_factor"),
+            "batt_kwh": _getf("batt_kwh"),
+            "eff": _getf("eff"),
+            "initial_soc": _getf("initial_soc"),
+            "pv_kwc": _getf("pv_kwc"),
+            "scenario": r.get("scenario") or scenario_default,
+        }
+
+    def _day_lines(self,
+                   f,
+                   days: list[str],
+                   ) -> list[str]:
+        """
+        Extrait, dans l'ordre du fichier, les lignes commençant par l'un des jours
+        demandés ('date' en 1re colonne), via mmap + bytes.find : seules ces lignes
+        sont décodées.
+        Args:
+            f: fichier CSV ouvert en lecture (texte)
+            days (list[str]): jours recherchés au format "YYYY-MM-DD"
+        Returns:
+            list[str]: lignes brutes (avec fin de ligne) des jours demandés
+        """
+        if not days:
+            return []
+        enc = f.encoding
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            starts = []
+            for d in days:
+                for pre in (b"\n", b'\n"'):  # date brute ou quotée
+                    needle = pre + d.encode(enc)
+                    pos = buf.find(needle)
+                    while pos >= 0:
+                        starts.append(pos + 1)
+                        pos = buf.find(needle, pos + 1)
+            starts.sort()
+            lines = []
+            for st in starts:
+                end = buf.find(b"\n", st)
+                lines.append(buf[st:len(buf) if end < 0 else end + 1].decode(enc))
+        return lines
+
+    def _scan_csv_once(self,
+                       csv_path: str,
+                       day: str | None = None,
+                       report: bool = False,
+                       days: int = 1,
+                       ) -> tuple[list, list, dict | None]:
+        """
+        Lecture du CSV en UNE seule passe : dates disponibles, lignes horaires
+        du (des) jour(s) demandé(s) et ligne meta (1re ligne du jour).
+        Si `day` est None, le premier jour (le plus ancien) du CSV est utilisé.
+        Args:
+            csv_path (str): chemin du fichier CSV
+            day (str, optional): jour de départ au format "YYYY-MM-DD". Defaults to None.
+            report (bool, optional): True pour un CSV "report", False pour un CSV "simu".
+                                     Defaults to False.
+            days (int, optional): nombre de jours consécutifs à lire (≥1). Defaults to 1.
+        Returns:
+            tuple: (dates_sorted, day_rows, meta_row)
+                   - dates_sorted : liste triée des jours présents
+                   - day_rows     : 24*days lignes (heures décalées 0..24*days-1),
+                                    vide si aucun jour dans le CSV
+                   - meta_row     : 1re ligne brute du jour de départ, {colonne: valeur} (ou None)
+        """
+        days = max(1, int(days))
+
+        def _window(d0: str) -> list:
+            try:
+                base_dt = datetime.fromisoformat(d0)
+            except ValueError:
+                return [d0]  # jour non ISO : sera signalé absent par l'appelant
+            return [(base_dt + timedelta(days=i)).date().isoformat() for i in range(days)]
+
+        key = self._file_key(csv_path)
+        cached = self._dates_cache.get(key) if key is not None else None
+        all_dates = set()
+        wanted = _window(day) if day else []
+        by_day = {d: [] for d in wanted}
+        first_day = day
+        meta_row = None
+
+        def _stack(by_day: dict) -> list:
+            out = []
+            for i, d in enumerate(wanted):
+                # décale l’index d’heure pour les axes (0..24*days-1)
+                for h, r in enumerate(self._fill_24h(by_day[d])):
+                    r["hour"] = i*24 + h
+                    out.append(r)
+            return out
+
+        if cached is not None and day and not cached[1].intersection(wanted):
+            # jours connus et absents du fichier : inutile de le relire
+            return cached[0], _stack(by_day), None
+
+        delim = self._auto_delim(csv_path)
+        with open(csv_path, "r", newline="", buffering=1 << 20) as f:
+            header = next(csv.reader([f.readline()], delimiter=delim), [])
+            idx = self._header_index(csv_path, header)
+            i_date = idx.get("date")
+            if i_date is None:
+                return [], [], None
+            # schéma fixé pour tout le fichier : parseur choisi une seule fois
+            parse = self._parse_hour_row_report if report else self._parse_hour_row_simu
+            lines = f
+            if cached is not None and cached[0] and i_date == 0:
+                # jours déjà connus : on saute directement aux lignes des jours voulus
+                if day is None:
+                    first_day = cached[0][0]
+                    wanted = _window(first_day)
+                    by_day = {k: [] for k in wanted}
+                lines = self._day_lines(f, [d for d in wanted if d in cached[1]])
+            for line in lines:
+                # 'date' en 1re colonne et non quotée : le jour est le préfixe de la ligne,
+                # inutile de passer la ligne entière au parseur csv
+                r = None
+                if i_date == 0 and line[:1] != '"':
+                    d = line[:10]
+                    if len(d) < 10 or delim in d or "\n" in d:
+                        continue
+                else:
+                    r = next(csv.reader([line], delimiter=delim), [])
+                    ts = r[i_date] if i_date < len(r) else ""
+                    if len(ts) < 10:
+                        continue
+                    d = ts[:10]
+                if cached is None:
+                    all_dates.add(d)
+                if day is None and (first_day is None or d < first_day):
+                    # nouveau premier jour : on recentre la fenêtre
+                    first_day = d
+                    wanted = _window(d)
+                    by_day = {k: by_day.get(k, []) for k in wanted}
+                    meta_row = None
+                if d not in by_day:
+                    continue
+                if r is None:
+                    # seules les lignes des jours demandés sont parsées
+                    r = next(csv.reader([line], delimiter=delim))
+                    ts = r[0]
+                if d == first_day and meta_row is None:
+                    meta_row = dict(zip(header, r))
+                h = self._hour_from(ts)
+                if h < 0:
+                    continue
+                by_day[d].append(parse(r, idx, h))
+
+        if cached is None:
+            cached = (sorted(all_dates), all_dates)
+            if key is not None:
+                self._cache_put(self._dates_cache, key, cached, self.FILE_CACHE_SIZE)
+        return cached[0], _stack(by_day), meta_row
+
+    @contextmanager
+    def _batch_console(self):
+        """
+        Contexte de rendu groupé : avec Rich, toutes les sorties console sont mises
+        en tampon et écrites en une seule fois à la sortie du bloc ; sans Rich,
+        stdout est vidé une seule fois à la fin.
+        Returns:
+            Iterator[None]: contexte à utiliser avec `with`
+        """
+        if self.has_rich:
+            with self.console:
+                yield
+        else:
+            try:
+                yield
+            finally:
+                sys.stdout.flush()
+
+    def _join_lines(self,
+                    lines: list,
+                    ) -> Text:
+        """
+        Concatène des lignes (Text ou str à balisage Rich) en un seul Text.
+        Args:
+            lines (list): lignes à concaténer
+        Returns:
+            Text: lignes séparées par des retours à la ligne
+        """
+        # str -> Text avec le même balisage/surlignage que console.print(str)
+        render = self.console.render_str
+        return Text("\n").join(l if isinstance(l, Text) else render(l) for l in lines)
+
+    def _print_lines(self,
+                     lines: list,
+                     ) -> None:
+        """
+        Affiche une liste de lignes (Text ou str) en un seul appel.
+        Args:
+            lines (list): lignes à afficher (Text si Rich, str sinon)
+        Returns:
+            None
+        """
+        if not lines:
+            return
+        if self.has_rich:
+            self.console.print(self._join_lines(lines))
+        else:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def _stack_cells(self,
+                     values: list,
+                     step_kwh: float,
+                     levels: int,
+                     ) -> list[int]:
+        """
+        Quantifie une pile de valeurs (kWh) en nombre de cellules par segment,
+        en rognant le plus gros segment si la pile dépasse `levels`.
+        Args:
+            values (list): valeurs des segments de la pile (kWh)
+            step_kwh (float): pas en kWh entre chaque niveau vertical
+            levels (int): nombre de niveaux disponibles
+        Returns:
+            list[int]: nombre de cellules par segment
+        """
+        cells = [int(round((v or 0.0) / step_kwh)) for v in values]
+        total = sum(cells)
+        if total > levels and cells:
+            # clip sur le plus gros segment
+            i = cells.index(max(cells))
+            cells[i] = max(0, cells[i] - (total - levels))
+        return cells
+
+    def _cell_style(self,
+                    style,
+                    ):
+        """
+        Style d'une cellule de graphe : les Style Rich précompilés (_STYLE_*) sont
+        utilisés tels quels, un balisage "[couleur]" est ramené à "couleur".
+        Args:
+            style (Style | str): style du segment
+        Returns:
+            Style | str: style utilisable par Text.append (ou marqueur non vide sans Rich)
+        """
+        return style.strip("[]") if isinstance(style, str) and self.has_rich else style
+
+    def _grid_line_builder(self,
+                           col_width: int,
+                           gap: int,
+                           ):
+        """
+        Prépare l'assemblage des lignes d'une grille : chaque cellule (barre colorée
+        ou vide, suivie de l'espacement) n'est construite qu'une fois par style,
+        puis réutilisée pour toutes les lignes du graphe.
+        Args:
+            col_width (int): largeur d'une barre par heure
+            gap (int): nombre d'espaces entre heures
+        Returns:
+            callable: line(ylab, styles) -> Text | str
+        """
+        full, empty, sep = "█" * col_width, " " * col_width, " " * gap
+
+        if not self.has_rich:
+            on, off = full + sep, empty + sep
+            return lambda ylab, styles: ylab + "".join(on if style else off for style in styles)
+
+        cells = {}
+        def _line(ylab: str, styles: list) -> Text:
+            parts = []
+            for style in styles:
+                cell = cells.get(style)
+                if cell is None:
+                    cell = cells[style] = Text.assemble((full, style), sep) if style else Text(empty + sep)
+                parts.append(cell)
+            return Text.assemble(ylab, *parts)
+        return _line
+
     def _build_columns(self, 
                        stacks_per_hour: list, 
                        max_kwh: float,
@@ -719,44 +1165,24 @@ class ConsoleUI:
 
         cols = []
         for hour_stack in stacks_per_hour:
-            cells_per_seg = [int(round((v or 0.0) / step_kwh)) for (v, _style) in hour_stack]
-            total_cells = sum(cells_per_seg)
-
-            if total_cells > levels and cells_per_seg:
-                excess = total_cells - levels
-                i_max = max(range(len(cells_per_seg)), key=lambda i: cells_per_seg[i])
-                cells_per_seg[i_max] = max(0, cells_per_seg[i_max] - excess)
+            cells_per_seg = self._stack_cells([v for (v, _style) in hour_stack], step_kwh, levels)
 
             col_styles = []
             for n, (_v, style) in zip(cells_per_seg, hour_stack):
                 if n > 0:
-                    col_styles.extend([style] * n)
+                    # accepte encore un balisage "[couleur]" (converti une fois par segment)
+                    col_styles.extend([self._cell_style(style)] * n)
             if len(col_styles) < levels:
                 col_styles.extend([""] * (levels - len(col_styles)))
 
             cols.append(col_styles[:levels])
 
-        # Construit les lignes haut -> bas
+        # Construit les lignes haut -> bas (cellules pré-assemblées, une ligne = un seul appel)
+        line = self._grid_line_builder(col_width, gap)
         grid_rows = []
         for lvl in reversed(range(levels)):
             y_label = f"{(lvl + 1) * step_kwh:>4.1f}│"
-            line = Text(y_label) if self.has_rich else y_label
-
-            for h in range(24):
-                style = cols[h][lvl]
-                block = "█" * col_width if style else " " * col_width
-                sep = " " * gap
-
-                if self.has_rich:
-                    if style:
-                        line.append(block, style=style.strip("[]"))
-                    else:
-                        line.append(block)
-                    line.append(sep)
-                else:
-                    line += block + sep
-
-            grid_rows.append(line)
+            grid_rows.append(line(y_label, [cols[h][lvl] for h in range(24)]))
 
         return grid_rows, levels
 
@@ -792,7 +1218,7 @@ class ConsoleUI:
         if self.has_rich:
             self.console.print(line)
         else:
-            print(line)
+            sys.stdout.write(line + "\n")
 
     def _fmt_pct(self, v: float | str | int | None) -> str:
         """
@@ -820,6 +1246,31 @@ class ConsoleUI:
             return f"{x*100:.0f} %"
         return f"{x:.0f} %"
 
+    def _cached_day(self,
+                    csv_path: str,
+                    key: tuple,
+                    compute,
+                    ):
+        """
+        Mémoïse un calcul sur les lignes d'un jour, par version du fichier (cf. _file_key) + `key`.
+        Le cache garde au plus TOTALS_CACHE_SIZE entrées (les plus anciennes sont évincées).
+        Args:
+            csv_path (str): chemin du CSV d'où viennent les lignes
+            key (tuple): complément de clé (jour, nb de jours, type de calcul…)
+            compute (callable): calcul à effectuer si absent du cache
+        Returns:
+            object: résultat (éventuellement mis en cache) de compute()
+        """
+        fkey = self._file_key(csv_path)
+        if fkey is None:
+            return compute()
+        k = (fkey, *key)
+        if k in self._totals_cache:
+            return self._totals_cache[k]
+        res = compute()
+        self._cache_put(self._totals_cache, k, res, self.TOTALS_CACHE_SIZE)
+        return res
+
     def _sum_day(self, day_rows: list) -> dict:
         """
         Sommes du jour et SoC début/fin (si présent).
@@ -835,45 +1286,21 @@ class ConsoleUI:
         3) Calcul des indicateurs AC et TC
         4) Retour du dictionnaire des totaux
         """
-        tot = {
-            "pv_direct": 0.0,
-            "pv_to_batt": 0.0,
-            "batt_to_load": 0.0,
-            "grid_to_batt": 0.0,
-            "imp_to_load": 0.0,
-            "import": 0.0,
-            "export": 0.0,
-            "pv": 0.0,
-            "load": 0.0,
-            "soc_start": None,
-            "soc_end": None
-        }
-        for i, r in enumerate(day_rows):
-            pvd = float(r.get("pv_direct", 0) or 0)
-            p2b = float(r.get("pv_to_batt", 0) or 0)
-            b2l = float(r.get("batt_to_load", 0) or 0)
-            g2b = float(r.get("grid_to_batt", 0) or 0)
-            i2l = float(r.get("imp_to_load", 0) or 0)
-            imp = float(r.get("import", 0) or 0)
-            exp = float(r.get("export", 0) or 0)
-            # si ton CSV contient 'pv' et 'load' par heure, prends-les, sinon reconstitue:
-            pv  = float(r.get("pv", pvd + p2b + exp) or 0)
-            load = float(r.get("load", pvd + b2l + imp) or 0)
-
-            tot["pv_direct"]   += pvd
-            tot["pv_to_batt"]  += p2b
-            tot["batt_to_load"]+= b2l
-            tot["grid_to_batt"]+= g2b
-            tot["imp_to_load"] += i2l
-            tot["import"]      += imp
-            tot["export"]      += exp
-            tot["pv"]          += pv
-            tot["load"]        += load
-
-            if "soc" in r and r["soc"] is not None and tot["soc_start"] is None:
-                tot["soc_start"] = float(r["soc"])
-            if "soc" in r and r["soc"] is not None:
-                tot["soc_end"] = float(r["soc"])
+        # lignes déjà converties en float par _parse_hour_row_* : somme colonne par colonne
+        tot = {k: sum(r.get(k, 0.0) for r in day_rows)
+               for k in ("pv_direct", "pv_to_batt", "batt_to_load", "grid_to_batt",
+                         "imp_to_load", "import", "export")}
+        # si le CSV contient 'pv' et 'load' par heure, on les prend, sinon on reconstitue
+        tot["pv"] = sum(r["pv"] if "pv" in r else
+                        r.get("pv_direct", 0.0) + r.get("pv_to_batt", 0.0) + r.get("export", 0.0)
+                        for r in day_rows)
+        tot["load"] = sum(r["load"] if "load" in r else
+                          r.get("pv_direct", 0.0) + r.get("batt_to_load", 0.0) + r.get("import", 0.0)
+                          for r in day_rows)
+
+        socs = [float(r["soc"]) for r in day_rows if r.get("soc") is not None]
+        tot["soc_start"] = socs[0] if socs else None
+        tot["soc_end"] = socs[-1] if socs else None
 
         # indicateurs
         ac = 0.0 if tot["pv"]   <= 0 else 100.0 * (tot["pv_direct"] + tot["pv_to_batt"]) / tot["pv"]
@@ -887,52 +1314,74 @@ class ConsoleUI:
                              totals: dict,
                              ) -> None:
         """
-        Affiche un panneau "Contexte" avec les paramètres de la simulation
+        Affiche le panneau "Contexte" (cf. _context_panel).
+        Args:
+            day (str): jour affiché
+            ctx (dict): paramètres de la simulation
+            totals (dict): totaux du jour (cf. _sum_day)
+        Returns:
+            None
+        """
+        self.console.print(self._context_panel(day, ctx, totals))
+
+    def _context_panel(self, day: str,
+                       ctx: dict,
+                       totals: dict,
+                       ) -> Panel:
+        """
+        Construit un panneau "Contexte" avec les paramètres de la simulation
         et les totaux du jour.
-        1) Construction d'une table avec les paramètres (si présents)
+        1) Construction des lignes (label, valeur) avec les paramètres (si présents)
         2) Ajout des totaux du jour
-        3) Affichage dans un panneau
+        3) Mise en panneau (un seul Text, labels alignés à droite)
         Args:
             day (str): jour au format "YYYY-MM-DD"
             ctx (dict): dictionnaire des paramètres de la simulation
             totals (dict): dictionnaire des totaux du jour
         Returns:
-            None
+            Panel: panneau Rich prêt à afficher
         """
 
-        t = Table.grid(expand=False)
-        t.add_column(justify="right", style="bold dim")
-        t.add_column(justify="left")
-
+        rows = []
         if ctx:
-            if "scenario" in ctx:   t.add_row("Scénario :", f"{ctx['scenario']}")
-            if "pv_kwc" in ctx:     t.add_row("PV installé :", f"{ctx['pv_kwc']} kWc")
-            if "pv_factor" in ctx:  t.add_row("Facteur PV :", f"x{ctx['pv_factor']}")
-            if "batt_kwh" in ctx:   t.add_row("Batterie :", f"{ctx['batt_kwh']} kWh")
+            if "scenario" in ctx:   rows.append(("Scénario :", f"{ctx['scenario']}"))
+            if "pv_kwc" in ctx:     rows.append(("PV installé :", f"{ctx['pv_kwc']} kWc"))
+            if "pv_factor" in ctx:  rows.append(("Facteur PV :", f"x{ctx['pv_factor']}"))
+            if "batt_kwh" in ctx:   rows.append(("Batterie :", f"{ctx['batt_kwh']} kWh"))
             if "eff" in ctx:
                 try:
                     eff = float(ctx["eff"])
-                    t.add_row("Rendement batt :", f"{eff*100:.0f} %")
+                    rows.append(("Rendement batt :", f"{eff*100:.0f} %"))
                 except Exception:
-                    t.add_row("Rendement batt :", str(ctx["eff"]))
+                    rows.append(("Rendement batt :", str(ctx["eff"])))
             if "initial_soc" in ctx:
-                t.add_row("SoC initial :", self._fmt_pct(ctx["initial_soc"]))
+                rows.append(("SoC initial :", self._fmt_pct(ctx["initial_soc"])))
             if ctx.get("grid_hours"):
-                t.add_row("HC réseau :", ", ".join(f"{int(h):02d}h" for h in ctx["grid_hours"]))
+                rows.append(("HC réseau :", ", ".join(f"{int(h):02d}h" for h in ctx["grid_hours"])))
             if "grid_target_soc" in ctx and ctx["grid_target_soc"] is not None:
-                t.add_row("Cible SoC HC :", self._fmt_pct(ctx["grid_target_soc"]))
+                rows.append(("Cible SoC HC :", self._fmt_pct(ctx["grid_target_soc"])))
 
         # Résumé jour
-        t.add_row("", "")
-        t.add_row("Jour :", day)
-        t.add_row("Prod (kWh) :", f"{totals['pv']:.1f} (dir {totals['pv_direct']:.1f} / batt {totals['pv_to_batt']:.1f} / exp {totals['export']:.1f})")
-        t.add_row("Conso (kWh) :", f"{totals['load']:.1f} (PVdir {totals['pv_direct']:.1f} / batt {totals['batt_to_load']:.1f} / imp {totals['import']:.1f})")
+        rows.append(("", ""))
+        rows.append(("Jour :", day))
+        rows.append(("Prod (kWh) :", f"{totals['pv']:.1f} (dir {totals['pv_direct']:.1f} / batt {totals['pv_to_batt']:.1f} / exp {totals['export']:.1f})"))
+        rows.append(("Conso (kWh) :", f"{totals['load']:.1f} (PVdir {totals['pv_direct']:.1f} / batt {totals['batt_to_load']:.1f} / imp {totals['import']:.1f})"))
         if totals.get("soc_start") is not None or totals.get("soc_end") is not None:
-            t.add_row("SoC (début→fin) :", f"{totals.get('soc_start','?')} → {totals.get('soc_end','?')}")
-        t.add_row("Autoconsommation :", f"{totals['ac']:.1f} %")
-        t.add_row("Couverture :", f"{totals['tc']:.1f} %")
+            rows.append(("SoC (début→fin) :", f"{totals.get('soc_start','?')} → {totals.get('soc_end','?')}"))
+        rows.append(("Autoconsommation :", f"{totals['ac']:.1f} %"))
+        rows.append(("Couverture :", f"{totals['tc']:.1f} %"))
+
+        # 2 colonnes sans variation de style par cellule : un seul Text
+        # (labels alignés à droite) plutôt qu'une Table.grid ligne par ligne
+        w = max(len(lbl) for lbl, _ in rows)
+        t = Text()
+        for i, (lbl, val) in enumerate(rows):
+            if i:
+                t.append("\n")
+            t.append(f"{lbl:>{w}}", style="bold dim")
+            t.append(val)
 
-        self.console.print(Panel(t, title="[bold]Contexte[/bold]", border_style="cyan"))    
+        return Panel(t, title="[bold]Contexte[/bold]", border_style="cyan")
 
     def _build_columns_bipolar(self,
                                stacks_up: list,
@@ -984,16 +1433,11 @@ class ConsoleUI:
             """
             cols = []
             for stack in stacks:
-                cells = [int(round((v or 0.0) / step_kwh)) for (v, _s) in stack]
-                total = sum(cells)
-                if total > levels and cells:
-                    # clip sur le plus gros segment
-                    i = max(range(len(cells)), key=lambda k: cells[k])
-                    cells[i] = max(0, cells[i] - (total - levels))
+                cells = self._stack_cells([v for (v, _s) in stack], step_kwh, levels)
                 col = []
                 for n, (_v, style) in zip(cells, stack):
                     if n > 0:
-                        col.extend([style] * n)
+                        col.extend([self._cell_style(style)] * n)
                 if len(col) < levels:
                     col.extend([""] * (levels - len(col)))
                 cols.append(col[:levels])  # bas -> haut
@@ -1003,21 +1447,12 @@ class ConsoleUI:
         cols_dn = build_cols(stacks_dn)    # bas->haut (on affichera sous 0)
 
         grid = []
+        _line = self._grid_line_builder(col_width, gap)
 
         # ---- PARTIE HAUTE : du haut vers 0 (labels positifs)
         for lvl in range(levels - 1, -1, -1):
             ylab = f"{(lvl + 1) * step_kwh:>4.1f}│"
-            line = Text(ylab) if self.has_rich else ylab
-            for h in range(hours):
-                style = cols_up[h][lvl]
-                block = "█" * col_width if style else " " * col_width
-                sep = " " * gap
-                if self.has_rich:
-                    line.append(block, style=style.strip("[]") if style else None)
-                    line.append(sep)
-                else:
-                    line += block + sep
-            grid.append(line)
+            grid.append(_line(ylab, [cols_up[h][lvl] for h in range(hours)]))
 
         # ---- LIGNE ZÉRO (pointillés)
         left = " " * 3 + "0│"
@@ -1028,17 +1463,7 @@ class ConsoleUI:
         # >>> ICI on AFFICHE DES LABELS POSITIFS (0.5, 1.0, …), MAIS on dessine en dessous de 0.
         for lvl in range(levels):
             ylab = f"{(lvl + 1) * step_kwh:>4.1f}│"  # labels POSITIFS
-            line = Text(ylab) if self.has_rich else ylab
-            for h in range(hours):
-                style = cols_dn[h][lvl]
-                block = "█" * col_width if style else " " * col_width
-                sep = " " * gap
-                if self.has_rich:
-                    line.append(block, style=style.strip("[]") if style else None)
-                    line.append(sep)
-                else:
-                    line += block + sep
-            grid.append(line)
+            grid.append(_line(ylab, [cols_dn[h][lvl] for h in range(hours)]))
         return grid, levels
 
     def _print_x_axis_bipolar(self,
@@ -1047,9 +1472,7 @@ class ConsoleUI:
                               hours: int = 24,
                               ) -> None:
         """
-        Affiche l'axe X aligné sous la grille bipolaire. Labels centrés sous chaque (col_width + gap).
-        1) Construction de la ligne avec labels centrés
-        2) Affichage
+        Affiche l'axe X aligné sous la grille bipolaire (cf. _x_axis_bipolar).
         Args:
             col_width (int): largeur d'une barre par heure
             gap (int, optional): nombre d'espaces entre heures. Defaults to 1.
@@ -1057,6 +1480,28 @@ class ConsoleUI:
         Returns:
             None
         """
+        line = self._x_axis_bipolar(col_width, gap, hours)
+        if self.has_rich:
+            self.console.print(line)
+        else:
+            sys.stdout.write(line + "\n")
+
+    def _x_axis_bipolar(self,
+                        col_width: int, 
+                        gap: int = 1,
+                        hours: int = 24,
+                        ) -> str:
+        """
+        Construit l'axe X aligné sous la grille bipolaire. Labels centrés sous chaque (col_width + gap).
+        1) Construction de la ligne avec labels centrés
+        2) Retour de la ligne
+        Args:
+            col_width (int): largeur d'une barre par heure
+            gap (int, optional): nombre d'espaces entre heures. Defaults to 1.
+            hours (int, optional): nombre d'heures (24 ou 48). Defaults to 24.
+        Returns:
+            str: ligne de l'axe X
+        """
         unit = col_width + gap
         left = " " * 3 + " │"   # aligne sous les labels Y (4) et le séparateur vertical
         
@@ -1069,11 +1514,7 @@ class ConsoleUI:
             # rjust pour éviter l'espace initial ajouté par center()
             parts.append(f"{h:02d}".ljust(unit))
 
-        line = left + "".join(parts)
-        if self.has_rich:
-            self.console.print(line)
-        else:
-            print(line)
+        return left + "".join(parts)
 
     def _metrics_from_rows(self,
                            rows: list[dict],
@@ -1095,19 +1536,45 @@ class ConsoleUI:
         3) Retour du dictionnaire des métriques
         Note : le calcul de "onsite" diffère selon le type de CSV.
         """
-        eps  = 1e-9
         pv   = sum(r.get("pv", 0.0) for r in rows)
         load = sum(r.get("load", 0.0) for r in rows)
         imp  = sum(r.get("import", 0.0) for r in rows)
         exp  = sum(r.get("export", 0.0) for r in rows)
+        if report:
+            return self._metrics_from_sums(pv, load, imp, exp, report=True)
+        pv_direct     = sum(float(r.get("pv_direct", 0.0))    for r in rows)
+        batt_to_load  = sum(float(r.get("batt_to_load", 0.0)) for r in rows)
+        return self._metrics_from_sums(pv, load, imp, exp, pv_direct, batt_to_load, report=False)
+
+    def _metrics_from_sums(self,
+                           pv: float,
+                           load: float,
+                           imp: float,
+                           exp: float,
+                           pv_direct: float = 0.0,
+                           batt_to_load: float = 0.0,
+                           report: bool = False,
+                           ) -> dict:
+        """
+        Calcule les métriques clés d'une journée à partir de ses totaux.
+        Args:
+            pv (float): production PV du jour (kWh)
+            load (float): consommation du jour (kWh)
+            imp (float): import réseau du jour (kWh)
+            exp (float): export réseau du jour (kWh)
+            pv_direct (float, optional): PV consommé directement (simu). Defaults to 0.0.
+            batt_to_load (float, optional): batterie vers charges (simu). Defaults to 0.0.
+            report (bool, optional): True pour un CSV "report". Defaults to False.
+        Returns:
+            dict: dictionnaire des métriques (cf. _metrics_from_rows)
+        """
+        eps  = 1e-9
         # --- Quantités utiles pour TC ---
         if report:
             # Sans colonnes batterie, la meilleure estimation de la conso couverte
             # est "load - import" (= PV direct + éventuelle batterie, si existait).
             onsite_tc = max(0.0, min(load, load - imp))
         else:
-            pv_direct     = sum(float(r.get("pv_direct", 0.0))    for r in rows)
-            batt_to_load  = sum(float(r.get("batt_to_load", 0.0)) for r in rows)
             # Couverture de charge (ne peut pas dépasser la conso)
             onsite_tc = max(0.0, min(load, pv_direct + batt_to_load))
             
@@ -1132,6 +1599,67 @@ class ConsoleUI:
                 "onsite_tc": onsite_tc, # Conso couverte ce jour (pour TC)
                 }
 
+    def _reduce_rows(self,
+                     rows: list[dict],
+                     is_report: bool = False,
+                     ) -> tuple[list, list, float, float, dict, dict]:
+        """
+        Une seule passe sur les lignes horaires pour produire à la fois les piles
+        du graphe bipolaire, leurs max, les totaux du jour et les métriques
+        (équivalent de _stacks_from_rows + _sum_day + _metrics_from_rows).
+            - CSV 'simu' : haut = PV direct / Batt→charges / Import,
+                           bas  = Grid→batt / PV→batt / Export
+            - CSV 'report' : haut = prod PV autoconsommée / Import, bas = Export
+        Args:
+            rows (list): lignes horaires (issues de _scan_csv_once)
+            is_report (bool, optional): True si le CSV est un rapport. Defaults to False.
+        Returns:
+            tuple: (up, dn, up_max, dn_max, totals, metrics)
+        """
+        up, dn = [], []
+        up_max = dn_max = 0.0
+        pvd_s = p2b_s = b2l_s = g2b_s = i2l_s = imp_s = exp_s = 0.0
+        pv_s = load_s = pv_m = load_m = 0.0
+        socs = []
+        for r in rows:
+            pvd = r.get("pv_direct", 0.0);    p2b = r.get("pv_to_batt", 0.0)
+            b2l = r.get("batt_to_load", 0.0); g2b = r.get("grid_to_batt", 0.0)
+            i2l = r.get("imp_to_load", 0.0)
+            imp = r.get("import", 0.0);       exp = r.get("export", 0.0)
+            pv  = r.get("pv", 0.0);           load = r.get("load", 0.0)
+
+            pvd_s += pvd; p2b_s += p2b; b2l_s += b2l; g2b_s += g2b; i2l_s += i2l
+            imp_s += imp; exp_s += exp
+            # totaux : si 'pv'/'load' absents, on reconstitue ; métriques : valeurs telles quelles
+            pv_s   += pv   if "pv"   in r else pvd + p2b + exp
+            load_s += load if "load" in r else pvd + b2l + imp
+            pv_m += pv; load_m += load
+            if r.get("soc") is not None:
+                socs.append(float(r["soc"]))
+
+            if not is_report:
+                up.append([(pvd, _STYLE_PV_DIRECT), (b2l, _STYLE_BATT_LOAD), (imp, _STYLE_IMPORT)])
+                dn.append([(g2b, _STYLE_GRID_BATT), (p2b, _STYLE_PV_BATT), (exp, _STYLE_EXPORT)])
+                up_max = max(up_max, pvd + b2l + imp)
+                dn_max = max(dn_max, p2b + exp)
+            else:
+                # Ici : on affiche séparément la prod PV (autoconsommée) et l'import
+                up.append([(min(pv, load), _STYLE_PV_DIRECT), (imp, _STYLE_IMPORT)])
+                dn.append([(exp, _STYLE_EXPORT)])
+                up_max = max(up_max, pv + imp)
+                dn_max = max(dn_max, exp)
+
+        totals = {
+            "pv_direct": pvd_s, "pv_to_batt": p2b_s, "batt_to_load": b2l_s,
+            "grid_to_batt": g2b_s, "imp_to_load": i2l_s,
+            "import": imp_s, "export": exp_s, "pv": pv_s, "load": load_s,
+            "soc_start": socs[0] if socs else None,
+            "soc_end": socs[-1] if socs else None,
+        }
+        totals["ac"] = 0.0 if pv_s   <= 0 else 100.0 * (pvd_s + p2b_s) / pv_s
+        totals["tc"] = 0.0 if load_s <= 0 else 100.0 * (pvd_s + b2l_s) / load_s
+        metrics = self._metrics_from_sums(pv_m, load_m, imp_s, exp_s, pvd_s, b2l_s, report=is_report)
+        return up, dn, up_max, dn_max, totals, metrics
 
     def _print_metrics_line(self,
                             title: str,
@@ -1213,6 +1741,24 @@ class ConsoleUI:
                                    gap: int = 1,
                                    ) -> None:
         """
+        Affiche les 2 encarts côte à côte sous les graphes (cf. _side_by_side_panels).
+        Args:
+            left_panel (Panel): panneau de gauche (Rich Panel)
+            right_panel (Panel): panneau de droite (Rich Panel)
+            col_width (int, optional): largeur d'une barre par heure. Defaults to 2.
+            gap (int, optional): nombre d'espaces entre heures. Defaults to 1.
+        Returns:
+            None
+        """
+        self.console.print(self._side_by_side_panels(left_panel, right_panel, col_width, gap))
+
+    def _side_by_side_panels(self,
+                             left_panel: Panel,
+                             right_panel: Panel,
+                             col_width: int = 2,
+                             gap: int = 1,
+                             ) -> Columns:
+        """
         Aligne les 2 encarts sous les graphes :
             - on indente à gauche de la largeur de l'axe Y (labels + '│')
             - on affiche dans deux colonnes égales
@@ -1222,33 +1768,24 @@ class ConsoleUI:
             col_width (int, optional): largeur d'une barre par heure. Defaults to 2.
             gap (int, optional): nombre d'espaces entre heures. Defaults to 1.
         Returns:
-            None
+            Columns: les deux encarts en colonnes, prêts à afficher
         1) Calcul de la largeur intérieure des panels (24 * col_width + 23 * gap)
-        2) Fixation de la largeur des panels (optionnel mais plus propre)
+        2) Fixation de la largeur des panels (attribut modifié en place, sans copie)
         3) Indentation à gauche de la largeur de l'axe Y
         4) Alignement à gauche dans chaque colonne (Columns centre par défaut)
-        5) Affichage dans deux colonnes égales
+        5) Mise en page dans deux colonnes égales
         6) Nécessite Rich
         7) Si Rich n'est pas dispo, cette fonction ne doit pas être appelée.
         """
-        # largeur d'indentation = exactement ce que tu utilises pour l'axe Y
-        # (dans tes graphes tu fais f"{val:>4.1f}│" → 4+1+1 = 6)
-        axis_pad = len(f"{0:>4.1f}│")  # == 6
-
-        # largeur intérieure des barres (24 heures) si tu veux fixer la largeur des panels
+        # largeur intérieure des barres (24 heures) : on fixe la largeur des panels
+        # directement sur l'objet (pas de reconstruction de Panel à chaque appel)
         plot_inner = 24 * col_width + (23 * gap)
-        # on fixe la largeur des panels à la largeur des barres (optionnel mais clean)
-        left_panel  = Panel(left_panel.renderable,
-                            title=left_panel.title,
-                            border_style=left_panel.border_style,
-                            box=left_panel.box,
-                            width=plot_inner)
-        right_panel = Panel(right_panel.renderable,
-                            title=right_panel.title,
-                            border_style=right_panel.border_style,
-                            box=right_panel.box,
-                            width=plot_inner)
-        
+        for panel in (left_panel, right_panel):
+            if panel.width != plot_inner:
+                panel.width = plot_inner
+            panel.title_align = "center"  # titres centrés sous les graphes
+        axis_pad = self.AXIS_PAD
+
         # indent by the Y-axis width so the panel starts exactly under the bars
         left_padded  = Padding(left_panel,  (0, 0, 0, axis_pad))
         right_padded = Padding(right_panel, (0, 39, 0, axis_pad))
@@ -1258,69 +1795,11 @@ class ConsoleUI:
         right_aligned = Align.left(right_padded)
 
         # deux colonnes égales, alignées avec les deux graphes
-        self.console.print(Columns([left_aligned, right_aligned], 
-                            equal=True,
-                            expand=True,
-                            padding=(0, 4)))
+        return Columns([left_aligned, right_aligned], 
+                       equal=True,
+                       expand=True,
+                       padding=(0, 4))
         
-    def _read_day_rows_many(self,
-                            csv_path: str,
-                            day: str,
-                            report: bool,
-                            days: int = 1,
-                            ) -> list[dict]:
-        """
-        Concatène days jours (24*days lignes). S’il manque des heures, remplit à 0.
-
-        Args:
-            csv_path (str): chemin vers le fichier CSV à lire
-            day (str): jour de départ au format "YYYY-MM-DD"
-            report (bool): si True, on s'attend à un CSV de type
-                           "report" (ex: exporté de PVOutput).
-                           Si False, on s'attend à un CSV de type
-                              "simu" (ex: exporté de la simu).
-            days (int): nombre de jours à concaténer (≥1)
-        Returns:
-            list: liste des dictionnaires horaires pour les jours demandés
-        1) Pour chaque jour, lire les lignes horaires
-        2) Si des heures manquent, les remplir avec des zéros
-        3) Décaler l'index d'heure pour les axes (0..24*days-1)
-        4) Retourner la liste complète (24*days lignes)
-        """
-        def _one(d):
-            """
-            Retourne les 24 lignes d’un jour, remplies à 0 si manquant
-            Args:
-                d (str): jour au format "YYYY-MM-DD"
-            Returns:
-                list: liste des 24 dictionnaires horaires
-            """
-            rows = self._read_day_rows(csv_path, d, report=report)
-            return rows or [{"hour": h, 
-                             "pv_direct":0.0,
-                             "pv_to_batt":0.0,
-                             "batt_to_load":0.0,
-                             "grid_to_batt":0.0,
-                             "imp_to_load":0.0,
-                             "import":0.0,
-                             "export":0.0,
-                             "pv":0.0,
-                             "load":0.0}
-                            for h in range(24)]
-
-        base_dt = datetime.fromisoformat(day)
-        out = []
-        for i in range(days):
-            d = (base_dt + timedelta(days=i)).date().isoformat()
-            rows = _one(d)
-            # décale l’index d’heure pour les axes (0..24*days-1)
-            for h, r in enumerate(rows):
-                rr = dict(r)
-                rr["hour"] = i*24 + h
-                out.append(rr)
-        return out  # 24*days lignes
-
-
     # ========= vue “axes” =========
     def plot_day_cli(self, 
                      csv_path: str,
@@ -1363,135 +1842,100 @@ class ConsoleUI:
         11) Nécessite Rich pour l'affichage amélioré.
         12) Si Rich n'est pas dispo, affiche un message d'erreur.
         """
-        # Auto-détection du séparateur
-        delim = self._auto_delim(csv_path)
-        all_dates = set()
-        with open(csv_path, "r", newline="") as f:
-            rdr = csv.DictReader(f, delimiter=delim)
-            for row in rdr:
-                ts = str(row.get("date", ""))
-                if len(ts) >= 10:
-                    all_dates.add(ts[:10])
-
-        if not all_dates:
-            msg = f"Aucune donnée trouvée dans {csv_path}"
-            if self.has_rich:
-                self.console.print(f"[red]❌ {msg}[/red]")
-            else:
-                print("❌ " + msg)
-            return
+        # sorties mises en tampon, écrites d'un bloc à la fin du tracé
+        with self._batch_console():
+            # Lecture unique du CSV : dates dispo + lignes du jour + 1re ligne brute (meta)
+            dates_sorted, day_rows, meta_row = self._scan_csv_once(csv_path, day)
+
+            if not dates_sorted:
+                msg = f"Aucune donnée trouvée dans {csv_path}"
+                if self.has_rich:
+                    self.console.print(f"[red]❌ {msg}[/red]")
+                else:
+                    print("❌ " + msg)
+                return
+
+            # Déterminer la date à tracer
+            if not day:
+                day = dates_sorted[0]  # par défaut : premier jour trouvé
+            elif day not in dates_sorted:
+                msg = f"La date {day} n'existe pas dans {csv_path}. Disponibles: {', '.join(dates_sorted)}"
+                if self.has_rich:
+                    self.console.print(f"[red]❌ {msg}[/red]")
+                else:
+                    print("❌ " + msg)
+                return
 
-        # Déterminer la date à tracer
-        dates_sorted = sorted(list(all_dates))
-        if not day:
-            day = dates_sorted[0]  # par défaut : premier jour trouvé
-        elif day not in all_dates:
-            msg = f"La date {day} n'existe pas dans {csv_path}. Disponibles: {', '.join(dates_sorted)}"
+            # Lignes du jour déjà extraites par _scan_csv_once
+            if not day_rows:
+                msg = f"Aucune donnée trouvée pour {day} dans {csv_path}"
+                if self.has_rich:
+                    self.console.print(f"[red]❌ {msg}[/red]")
+                else:
+                    print("❌ " + msg)
+                return
+
+            # ---- extraire contexte depuis la première ligne du jour, si présent ----
+            meta_ctx = self._meta_from_row(meta_row)
+
+            # Contexte final = meta du CSV (prioritaire) éventuellement fusionné avec `context=` passé par l'appelant
+            ctx = {**(context or {}), **{k: v for k, v in meta_ctx.items() if v is not None}}
+            totals = self._cached_day(csv_path, (day, 1, "sum"), lambda: self._sum_day(day_rows))
+
+            # Affiche le contexte AVANT les deux graphes
             if self.has_rich:
-                self.console.print(f"[red]❌ {msg}[/red]")
+                self._print_context_panel(day, ctx, totals)
             else:
                 print("❌ " + msg)
-            return
+                return
 
-        # Lecture des lignes pour ce jour uniquement
-        day_rows = self._read_day_rows(csv_path, day)
-        if not day_rows:
-            msg = f"Aucune donnée trouvée pour {day} dans {csv_path}"
+            # --------- 1) Consommation couverte ---------
             if self.has_rich:
-                self.console.print(f"[red]❌ {msg}[/red]")
+                self.console.print(Panel.fit(f"[bold cyan]Consommation d'électricité[/bold cyan]\n{day}"))
             else:
-                print("❌ " + msg)
-            return
-
-        # ---- extraire contexte depuis la première ligne du jour, si présent ----
-        meta_ctx = {}
-        try:
-            # relire la 1re ligne brute du jour pour attraper les colonnes meta
-            delim = self._auto_delim(csv_path)
-            with open(csv_path, "r", newline="") as f:
-                rdr = csv.DictReader(f, delimiter=delim)
-                for r in rdr:
-                    ts = str(r.get("date",""))
-                    if ts.startswith(day):
-                        # colonnes meta si elles existent
-                        def _getf(key): 
-                            v = r.get(key)
-                            try: return float(v) if v not in (None,"") else None
-                            except: return v
-                        meta_ctx = {
-                            "pv_factor": _getf("pv_factor"),
-                            "batt_kwh": _getf("batt_kwh"),
-                            "eff": _getf("eff"),
-                            "initial_soc": _getf("initial_soc"),
-                            "pv_kwc": _getf("pv_kwc"),
-                            "scenario": r.get("scenario") or None,
-                        }
-                        break
-        except Exception:
-            meta_ctx = {}
-
-        # Contexte final = meta du CSV (prioritaire) éventuellement fusionné avec `context=` passé par l'appelant
-        ctx = {**(context or {}), **{k: v for k, v in meta_ctx.items() if v is not None}}
-        totals = self._sum_day(day_rows)
-
-        # Affiche le contexte AVANT les deux graphes
-        if self.has_rich:
-            self._print_context_panel(day, ctx, totals)
-        else:
-            print("❌ " + msg)
-            return
-
-        # --------- 1) Consommation couverte ---------
-        if self.has_rich:
-            self.console.print(Panel.fit(f"[bold cyan]Consommation d'électricité[/bold cyan]\n{day}"))
-        else:
-            print(f"\nConsommation d'électricité — {day}")
+                print(f"\nConsommation d'électricité — {day}")
             
-        conso_stacks = []
-        for r in day_rows:
-            pvd = r["pv_direct"]; b2l = r["batt_to_load"]; imp = r["import"]
-            conso_stacks.append([
-                (pvd, "[orange1]"),
-                (b2l, "[magenta]"),
-                (imp, "[blue]"),
-            ])
+            conso_stacks = []
+            for r in day_rows:
+                pvd = r["pv_direct"]; b2l = r["batt_to_load"]; imp = r["import"]
+                conso_stacks.append([
+                    (pvd, _STYLE_PV_DIRECT),
+                    (b2l, _STYLE_BATT_LOAD),
+                    (imp, _STYLE_IMPORT),
+                ])
 
-        grid_rows, levels = self._build_columns(conso_stacks, max_kwh, step_kwh, col_width + 1)
+            grid_rows, levels = self._build_columns(conso_stacks, max_kwh, step_kwh, col_width + 1)
 
-        for line in grid_rows:
-            if self.has_rich: self.console.print(line)
-            else: print(line)
+            self._print_lines(grid_rows)
 
-        self._print_x_axis(levels, col_width)
+            self._print_x_axis(levels, col_width)
 
-        if self.has_rich:
-            self.console.print("[dim]Légende : [orange1]PV direct[/], [magenta]Batterie→charges[/], [blue]Import[/][/dim]")
-            self.console.print(Rule())
+            if self.has_rich:
+                self.console.print("[dim]Légende : [orange1]PV direct[/], [magenta]Batterie→charges[/], [blue]Import[/][/dim]")
+                self.console.print(Rule())
 
-        # --------- 2) Disposition de la production ---------
-        if self.has_rich:
-            self.console.print(Panel.fit(f"[bold green]Production solaire[/bold green]\n{day}"))
-        else:
-            print(f"\nProduction solaire — {day}")
+            # --------- 2) Disposition de la production ---------
+            if self.has_rich:
+                self.console.print(Panel.fit(f"[bold green]Production solaire[/bold green]\n{day}"))
+            else:
+                print(f"\nProduction solaire — {day}")
 
-        pv_stacks = []
-        for r in day_rows:
-            pvd = r["pv_direct"]; p2b = r["pv_to_batt"]; exp = r["export"]
-            pv_stacks.append([
-                (pvd, "[orange1]"),
-                (p2b, "[yellow3]"),
-                (exp, "[grey74]"),
-            ])
+            pv_stacks = []
+            for r in day_rows:
+                pvd = r["pv_direct"]; p2b = r["pv_to_batt"]; exp = r["export"]
+                pv_stacks.append([
+                    (pvd, _STYLE_PV_DIRECT),
+                    (p2b, _STYLE_PV_BATT),
+                    (exp, _STYLE_EXPORT),
+                ])
 
-        grid_rows, levels = self._build_columns(pv_stacks, max_kwh, step_kwh, col_width + 1)
+            grid_rows, levels = self._build_columns(pv_stacks, max_kwh, step_kwh, col_width + 1)
 
-        for line in grid_rows:
-            if self.has_rich: self.console.print(line)
-            else: print(line)
+            self._print_lines(grid_rows)
 
-        self._print_x_axis(levels, col_width)
-        if self.has_rich:
-            self.console.print("[dim]Légende : [orange1]PV direct[/], [yellow3]PV→batterie[/], [grey74]Export[/][/dim]")
+            self._print_x_axis(levels, col_width)
+            if self.has_rich:
+                self.console.print("[dim]Légende : [orange1]PV direct[/], [yellow3]PV→batterie[/], [grey74]Export[/][/dim]")
 
     def plot_day_cli_bipolar(self, 
                              csv_path: str,
@@ -1541,107 +1985,77 @@ class ConsoleUI:
         14) Nécessite Rich pour l'affichage amélioré.
         15) Si Rich n'est pas dispo, affiche un message d'erreur.
         """
-        # auto-sélection du jour si non précisé
-        delim = self._auto_delim(csv_path)
-        all_dates = set()
-        with open(csv_path, "r", newline="") as f:
-            rdr = csv.DictReader(f, delimiter=delim)
-            for row in rdr:
-                ts = str(row.get("date", ""))
-                if len(ts) >= 10:
-                    all_dates.add(ts[:10])
-        if not all_dates:
-            msg = f"Aucune donnée trouvée dans {csv_path}"
-            self.console.print(f"[red]❌ {msg}[/red]" if self.has_rich else "❌ "+msg)
-            return
-        dates_sorted = sorted(all_dates)
-        if not day:
-            day = dates_sorted[0]
-        elif day not in all_dates:
-            msg = f"La date {day} n'existe pas dans {csv_path}. Disponibles: {', '.join(dates_sorted)}"
-            self.console.print(f"[red]❌ {msg}[/red]" if self.has_rich else "❌ "+msg)
-            return
+        # sorties mises en tampon, écrites d'un bloc à la fin du tracé
+        with self._batch_console():
+            # lecture unique du CSV : dates dispo + lignes du jour + 1re ligne brute (meta)
+            dates_sorted, day_rows, meta_row = self._scan_csv_once(csv_path, day)
+            if not dates_sorted:
+                msg = f"Aucune donnée trouvée dans {csv_path}"
+                self.console.print(f"[red]❌ {msg}[/red]" if self.has_rich else "❌ "+msg)
+                return
+            # auto-sélection du jour si non précisé
+            if not day:
+                day = dates_sorted[0]
+            elif day not in dates_sorted:
+                msg = f"La date {day} n'existe pas dans {csv_path}. Disponibles: {', '.join(dates_sorted)}"
+                self.console.print(f"[red]❌ {msg}[/red]" if self.has_rich else "❌ "+msg)
+                return
 
-        # lecture des lignes jour
-        day_rows = self._read_day_rows(csv_path, day)
-        if not day_rows:
-            msg = f"Aucune donnée trouvée pour {day} dans {csv_path}"
-            self.console.print(f"[red]❌ {msg}[/red]" if self.has_rich else "❌ "+msg)
-            return
+            if not day_rows:
+                msg = f"Aucune donnée trouvée pour {day} dans {csv_path}"
+                self.console.print(f"[red]❌ {msg}[/red]" if self.has_rich else "❌ "+msg)
+                return
 
-        # méta-contexte depuis 1ère ligne + context param
-        meta_ctx = {}
-        try:
-            with open(csv_path, "r", newline="") as f:
-                rdr = csv.DictReader(f, delimiter=delim)
-                for r in rdr:
-                    ts = str(r.get("date",""))
-                    if ts.startswith(day):
-                        def _getf(k):
-                            v = r.get(k)
-                            try: return float(v) if v not in (None,"") else None
-                            except: return v
-                        meta_ctx = {
-                            "pv_factor": _getf("pv_factor"),
-                            "batt_kwh": _getf("batt_kwh"),
-                            "eff": _getf("eff"),
-                            "initial_soc": _getf("initial_soc"),
-                            "pv_kwc": _getf("pv_kwc"),
-                            "scenario": r.get("scenario") or None,
-                        }
-                        break
-        except Exception:
-            meta_ctx = {}
-        ctx = {**(context or {}), **{k:v for k,v in meta_ctx.items() if v is not None}}
+            # méta-contexte depuis 1ère ligne + context param
+            meta_ctx = self._meta_from_row(meta_row)
+            ctx = {**(context or {}), **{k:v for k,v in meta_ctx.items() if v is not None}}
 
-        # totaux & panneau de contexte
-        totals = self._sum_day(day_rows)
-        if self.has_rich:
-            self._print_context_panel(day, ctx, totals)
-
-        # stacks haut = conso couverte ; bas = disposition PV
-        up = []
-        dn = []
-        up_max, dn_max = 0.0, 0.0
-        for r in day_rows:
-            pvd = r["pv_direct"]; b2l = r["batt_to_load"]; imp = r["import"]
-            p2b = r["pv_to_batt"]; exp = r["export"]
-            up.append([
-                (pvd, "[orange1]"),
-                (b2l, "[magenta]"),
-                (imp, "[blue]"),
-            ])
-            dn.append([
-                (p2b, "[yellow3]"),
-                (exp, "[grey74]"),
-            ])
-            up_max = max(up_max, pvd + b2l + imp)
-            dn_max = max(dn_max, p2b + exp)
-
-        # Autoscale symétrique si max_kwh non fourni
-        if max_kwh is None:
-            m = max(up_max, dn_max)
-            # arrondit à un multiple de step_kwh (ex : 0.5 → 0.5, 0.8 → 1.0, etc.)
-            max_kwh = step_kwh * math.ceil(m / step_kwh)
-            if max_kwh == 0: 
-                max_kwh = step_kwh
-
-        # construire et afficher la grille bipolaire
-        if self.has_rich:
-            self.console.print(Panel.fit(f"[bold]Profil horaire[/bold]\n{day}"))
+            # totaux & panneau de contexte
+            totals = self._cached_day(csv_path, (day, 1, "sum"), lambda: self._sum_day(day_rows))
+            if self.has_rich:
+                self._print_context_panel(day, ctx, totals)
+
+            # stacks haut = conso couverte ; bas = disposition PV
+            up = []
+            dn = []
+            up_max, dn_max = 0.0, 0.0
+            for r in day_rows:
+                pvd = r["pv_direct"]; b2l = r["batt_to_load"]; imp = r["import"]
+                p2b = r["pv_to_batt"]; exp = r["export"]
+                up.append([
+                    (pvd, _STYLE_PV_DIRECT),
+                    (b2l, _STYLE_BATT_LOAD),
+                    (imp, _STYLE_IMPORT),
+                ])
+                dn.append([
+                    (p2b, _STYLE_PV_BATT),
+                    (exp, _STYLE_EXPORT),
+                ])
+                up_max = max(up_max, pvd + b2l + imp)
+                dn_max = max(dn_max, p2b + exp)
+
+            # Autoscale symétrique si max_kwh non fourni
+            if max_kwh is None:
+                m = max(up_max, dn_max)
+                # arrondit à un multiple de step_kwh (ex : 0.5 → 0.5, 0.8 → 1.0, etc.)
+                max_kwh = step_kwh * math.ceil(m / step_kwh)
+                if max_kwh == 0: 
+                    max_kwh = step_kwh
+
+            # construire et afficher la grille bipolaire
+            if self.has_rich:
+                self.console.print(Panel.fit(f"[bold]Profil horaire[/bold]\n{day}"))
 
-        grid, _levels = self._build_columns_bipolar(up, dn, max_kwh, step_kwh, col_width, gap)
-        for line in grid:
-            if self.has_rich: self.console.print(line)
-            else: print(line)
+            grid, _levels = self._build_columns_bipolar(up, dn, max_kwh, step_kwh, col_width, gap)
+            self._print_lines(grid)
 
-        self._print_x_axis_bipolar(col_width, gap)
+            self._print_x_axis_bipolar(col_width, gap)
 
-        if self.has_rich:
-            self.console.print(
-                "[dim]Haut : [orange1]PV direct[/], [magenta]Batt→charges[/], [blue]Import[/]  "
-                "Bas : [yellow3]PV→batterie[/], [grey74]Export[/][/dim]"
-            )
+            if self.has_rich:
+                self.console.print(
+                    "[dim]Haut : [orange1]PV direct[/], [magenta]Batt→charges[/], [blue]Import[/]  "
+                    "Bas : [yellow3]PV→batterie[/], [grey74]Export[/][/dim]"
+                )
 
     def plot_day_cli_bipolar_compare(self,
                                      base_csv_path: str,
@@ -1700,269 +2114,143 @@ class ConsoleUI:
         14) Nécessite Rich pour l'affichage amélioré.
         15) Si Rich n'est pas dispo, affiche un message d'erreur.
         """
-        def _first_day(csv_path: str) -> str | None:
-            """_summary_
-
-            Args:
-                csv_path (str): _description_
-
-            Returns:
-                str | None: _description_
-            """
-            delim = self._auto_delim(csv_path)
-            days = set()
-            with open(csv_path, "r", newline="") as f:
-                for r in csv.DictReader(f, delimiter=delim):
-                    ts = str(r.get("date", ""))
-                    if len(ts) >= 10:
-                        days.add(ts[:10])
-            return sorted(days)[0] if days else None
-
-        # Choix du jour (par défaut : premier jour dispo dans le CSV “base”)
-        if not day:
-            day = _first_day(base_csv_path)
+        # sorties mises en tampon, écrites d'un bloc à la fin du tracé
+        with self._batch_console():
+            # Nombre de jours à empiler
+            hours = 24 * days
+            # Si days > 1 on force l’empilement vertical, sauf si tu veux garder le contrôle manuel :
+            if days > 1:
+                stack_when_multi = True
+
+            # Lecture unique de chaque CSV (jours dispo + lignes + meta).
+            # Jour connu : les deux fichiers (indépendants, lecture seule) sont lus en parallèle.
+            # Jour par défaut : premier jour dispo dans le CSV “base”, lu d'abord.
+            sim_scan = None
+            if day:
+                with ThreadPoolExecutor(max_workers=2) as ex:
+                    fut_base = ex.submit(self._scan_csv_once, base_csv_path, day, report=True, days=days)
+                    fut_sim  = ex.submit(self._scan_csv_once, sim_csv_path, day, report=False, days=days)
+                    base_dates, base_rows, _ = fut_base.result()
+                    sim_scan = fut_sim.result()
+            else:
+                base_dates, base_rows, _ = self._scan_csv_once(base_csv_path, day, report=True, days=days)
             if not day:
-                self.console.print("[red]❌ Aucun jour détecté dans le CSV de base[/red]" if self.has_rich else "❌ Aucun jour dans le CSV de base")
+                if not base_dates:
+                    self.console.print("[red]❌ Aucun jour détecté dans le CSV de base[/red]" if self.has_rich else "❌ Aucun jour dans le CSV de base")
+                    return
+                day = base_dates[0]
+            if not base_rows:
+                self.console.print(f"[red]❌ Pas de données 'Actuel' pour {day}[/red]" if self.has_rich else f"❌ Pas de données 'Actuel' pour {day}")
                 return
 
-        # Nombre de jours à empiler
-        hours = 24 * days
-        # Si days > 1 on force l’empilement vertical, sauf si tu veux garder le contrôle manuel :
-        if days > 1:
-            stack_when_multi = True
-
-        # Lecture des lignes du jour (ou plusieurs jours) (base + sim)
-        if stack_when_multi:
-            base_rows = self._read_day_rows_many(base_csv_path, day, report=True,  days=days)
-        else:
-            base_rows = self._read_day_rows(base_csv_path, day, report = True)
-        if not base_rows:
-            self.console.print(f"[red]❌ Pas de données 'Actuel' pour {day}[/red]" if self.has_rich else f"❌ Pas de données 'Actuel' pour {day}")
-            return
-        
-        if stack_when_multi:
-            sim_rows  = self._read_day_rows_many(sim_csv_path, day, report=False, days=days)
-        else:
-            sim_rows  = self._read_day_rows(sim_csv_path, day, report=False)
-        if not sim_rows:
-            self.console.print(f"[red]❌ Pas de données 'Simulé' pour {day}[/red]" if self.has_rich else f"❌ Pas de données 'Simulé' pour {day}")
-            return
-
-        # Totaux + contexte (si tu veux afficher deux panneaux au-dessus)
-        base_tot = self._sum_day(base_rows)
-        sim_tot  = self._sum_day(sim_rows)
-
-        # Contexte depuis CSV (1re ligne du jour), prioritaire sur context_*
-        def _meta_from_csv(csv_path: str, day: str) -> dict:
-            try:
-                delim = self._auto_delim(csv_path)
-                with open(csv_path, "r", newline="") as f:
-                    for r in csv.DictReader(f, delimiter=delim):
-                        ts = str(r.get("date",""))
-                        if ts.startswith(day):
-                            def _getf(k):
-                                v = r.get(k)
-                                try: return float(v) if v not in (None,"") else None
-                                except: return v
-                            return {
-                                "pv_factor": _getf("pv_factor"),
-                                "batt_kwh": _getf("batt_kwh"),
-                                "eff": _getf("eff"),
-                                "initial_soc": _getf("initial_soc"),
-                                "pv_kwc": _getf("pv_kwc"),
-                                "scenario": r.get("scenario") or "Comparatif horaire",
-                            }
-            except Exception:
-                pass
-            return {}
-
-        ctx  = {**(context or {}),  **{k:v for k,v in _meta_from_csv(sim_csv_path, day).items() if v is not None}}
+            if sim_scan is None:
+                sim_scan = self._scan_csv_once(sim_csv_path, day, report=False, days=days)
+            _, sim_rows, sim_meta = sim_scan
+            if not sim_rows:
+                self.console.print(f"[red]❌ Pas de données 'Simulé' pour {day}[/red]" if self.has_rich else f"❌ Pas de données 'Simulé' pour {day}")
+                return
 
-        # --- Prépare stacks (haut/bas) et max pour les DEUX graphes ---
-        def _stacks_from_rows(rows: list,
-                              is_report: bool = False,
-                              ) -> tuple[list, list, float, float]:
-            """
-            Fabrique les piles haut/bas et retourne (up, dn, up_max, dn_max).
-                - Si le CSV est 'simu' (avec pv_direct/pv_to_batt/batt_to_load), on les utilise.
-                - Si le CSV est 'report' (pv_diff/load_diff/import/export), on déduit pv_direct/import/export.
-            Args:
-                rows (list): liste des lignes horaires du jour
-                is_report (bool, optional): True si le CSV est un rapport (pv_diff/load_diff/import/export).
-                                            False si le CSV est une simulation complète (pv_direct/pv_to_batt/batt_to_load).
-            Returns:
-                tuple: (up, dn, up_max, dn_max)
-            1) Parcourt les lignes horaires
-            2) Détecte le type de ligne (report ou simu complète)
-            3) Construit les stacks haut et bas
-            4) Calcule les max haut et bas
-            5) Retourne les stacks et max
-            6) Note : dans le cas d'un rapport, on affiche séparément la prod PV et la conso totale.
-            7) Dans le cas d'une simu complète, on affiche la conso couverte (PV direct + Batt→charges + Import).
-            8) Dans les deux cas, on affiche la disposition de la prod PV (PV direct + PV→batt + Export).
-            9) Nécessite Rich pour l'affichage amélioré.
-            """
-            up, dn = [], []
-            up_max = dn_max = 0.0
-            for r in rows:
-                # détecte le type de ligne
-                if not is_report and "pv_direct" in r:
-                    # Simulation complète => on affiche tout
-                    pvd = float(r.get("pv_direct", 0) or 0)
-                    b2l = float(r.get("batt_to_load", 0) or 0)
-                    imp = float(r.get("import", 0) or 0)
-                    p2b = float(r.get("pv_to_batt", 0) or 0)
-                    exp = float(r.get("export", 0) or 0)
-                    g2b = float(r.get("grid_to_batt", 0) or 0)
-                    i2l = float(r.get("imp_to_load", 0) or 0)
-                    
-                    up.append([(pvd, "[orange1]"), (b2l, "[magenta]"), (imp, "[blue]")])
-                    dn.append([(g2b, "[#00BFFF]"), (p2b, "[yellow3]"), (exp, "[grey74]")])
-
-                    up_max = max(up_max, pvd + b2l + imp)
-                    dn_max = max(dn_max, p2b + exp)
+            # Une seule passe par série : piles (haut/bas) + max, totaux et métriques
+            # (mémoïsée par fichier/jour : un nouveau tracé du même jour ne refait pas la passe)
+            base_up, base_dn, base_upmax, base_dnmax, base_tot, m_base = self._cached_day(
+                base_csv_path, (day, days, "report"), lambda: self._reduce_rows(base_rows, is_report=True))
+            sim_up,  sim_dn,  sim_upmax,  sim_dnmax,  sim_tot,  m_sim  = self._cached_day(
+                sim_csv_path, (day, days, "simu"), lambda: self._reduce_rows(sim_rows, is_report=False))
+
+            # Contexte depuis CSV (1re ligne du jour), prioritaire sur context_*
+            ctx  = {**(context or {}),  **{k:v for k,v in self._meta_from_row(sim_meta, "Comparatif horaire").items() if v is not None}}
+
+            # Échelle commune (symétrique)
+            if max_kwh is None:
+                m = max(base_upmax, base_dnmax, sim_upmax, sim_dnmax)
+                if m > 0:
+                    max_kwh = (step_kwh * math.ceil(m / step_kwh)) + step_kwh
                 else:
-                    # CSV report (pv_diff/load_diff/import/export)
-                    pv   = float(r.get("pv_diff", 0) or r.get("pv", 0) or 0)
-                    load = float(r.get("load_diff", 0) or r.get("load", 0) or 0)
-                    imp  = float(r.get("import", max(load - pv, 0)) or 0)
-                    exp  = float(r.get("export", max(pv - load, 0)) or 0)
-
-                    prod_cons = min(pv, load)
-                    # Ici : on affiche séparément la prod PV et la conso totale
-                    #up.append([(pv, "[orange1]"), (load, "[cyan]"), (imp, "[blue]")])
-                    up.append([(prod_cons, "[orange1]"), (imp, "[blue]")])
-                    dn.append([(exp, "[grey74]")])
-
-                    up_max = max(up_max, pv + imp)
-                    dn_max = max(dn_max, exp)
-
-            return up, dn, up_max, dn_max
-
-        base_up, base_dn, base_upmax, base_dnmax = _stacks_from_rows(base_rows, is_report=True)
-        sim_up,  sim_dn,  sim_upmax,  sim_dnmax  = _stacks_from_rows(sim_rows, is_report=False)
-
-        # Échelle commune (symétrique)
-        if max_kwh is None:
-            m = max(base_upmax, base_dnmax, sim_upmax, sim_dnmax)
-            if m > 0:
-                max_kwh = (step_kwh * math.ceil(m / step_kwh)) + step_kwh
-            else:
-                step_kwh
-
-        # Construire les deux grilles
-        base_grid, _ = self._build_columns_bipolar(base_up, base_dn, max_kwh, step_kwh, col_width, gap)
-        sim_grid,  _ = self._build_columns_bipolar(sim_up,  sim_dn,  max_kwh, step_kwh, col_width, gap)
-
-        # Titre colonnes
-        def _title_cell(txt: str,
-                        width_chars: int,
-                        ) -> Text | str:
-            """ 
-            Formatte une cellule titre de largeur fixe (pour aligner les deux grilles).
-            Args:
-                txt (str): texte du titre
-                width_chars (int): largeur totale en caractères (incluant le texte)
-            Returns:
-                Text | str: texte formaté (Rich Text si possible)
-            1) Calcule la largeur totale du graphe (axe Y + 24 barres + espaces)
-            2) Calcule le padding nécessaire pour atteindre cette largeur
-            3) Retourne le texte formaté avec le padding
-            4) Nécessite Rich pour l'affichage amélioré.
-            5) Si Rich n'est pas dispo, retourne une chaîne simple.
-            """
-            # Largeur totale d’un graphe : 4(pour Y) + 2(caractères '0│' ou ' x│') + 24*(col_width+gap)
-            total = 4 + 2 + 24 * (col_width + gap)
-            t = Text(txt, style="bold") if self.has_rich else txt
-            pad = max(0, total - len(txt))
-            if self.has_rich:
-                return t + Text(" " * pad)
-            return txt + " " * pad
-
-        if self.has_rich:
-            # Contexte sous les titres
-            self._print_context_panel(day, ctx, sim_tot)
-        # Rendu : côte-à-côte (24h) ou empilé (48h…)
-        if not stack_when_multi:
-            # Concaténer ligne-à-ligne les deux grilles
-            spacer = "    "
-            if self.has_rich:
-                self.console.print(
-                    _title_cell(titles[0], 0) + Text("    ") + _title_cell(titles[1], 0)
-                )
-            for i in range(len(base_grid)):
-                left_line = base_grid[i]
-                right_line = sim_grid[i]
+                    step_kwh
+
+            # Construire les deux grilles
+            base_grid, _ = self._build_columns_bipolar(base_up, base_dn, max_kwh, step_kwh, col_width, gap)
+            sim_grid,  _ = self._build_columns_bipolar(sim_up,  sim_dn,  max_kwh, step_kwh, col_width, gap)
+
+            # Titre colonnes
+            def _title_cell(txt: str,
+                            width_chars: int,
+                            ) -> Text | str:
+                """ 
+                Formatte une cellule titre de largeur fixe (pour aligner les deux grilles).
+                Args:
+                    txt (str): texte du titre
+                    width_chars (int): largeur totale en caractères (incluant le texte)
+                Returns:
+                    Text | str: texte formaté (Rich Text si possible)
+                1) Calcule la largeur totale du graphe (axe Y + 24 barres + espaces)
+                2) Calcule le padding nécessaire pour atteindre cette largeur
+                3) Retourne le texte formaté avec le padding
+                4) Nécessite Rich pour l'affichage amélioré.
+                5) Si Rich n'est pas dispo, retourne une chaîne simple.
+                """
+                # Largeur totale d’un graphe : 4(pour Y) + 2(caractères '0│' ou ' x│') + 24*(col_width+gap)
+                total = 4 + 2 + 24 * (col_width + gap)
+                t = Text(txt, style="bold") if self.has_rich else txt
+                pad = max(0, total - len(txt))
                 if self.has_rich:
-                    out = Text.assemble(left_line, Text(spacer), right_line)
-                    self.console.print(out)
-                else:
-                    print(str(left_line) + spacer + str(right_line))
+                    return t + Text(" " * pad)
+                return txt + " " * pad
 
+            spacer = "    "
             # Axe des heures (une fois, au centre : on duplique pour l’alignement)
             unit = col_width + gap
             left_axis  = " " * 4 + "│" + "".join(f"{h:02d}".ljust(unit) for h in range(24))
             right_axis = left_axis
-            if self.has_rich:
-                self.console.print(Text(left_axis) + Text(spacer) + Text(right_axis))
-            else:
-                print(left_axis + spacer + right_axis)
 
-            m_base = self._metrics_from_rows(base_rows, report=True)
-            m_sim = self._metrics_from_rows(sim_rows, report=False)
             if self.has_rich:
-                p1 = self._print_metrics_panel("Actuel", m_base, style="cyan")
-                p2 = self._print_metrics_panel("Simulé", m_sim, style="magenta")
-                # deux encarts côte à côte
-                self._print_side_by_side_panels(p1, p2, col_width=2, gap=0)
-            else:
-                # fallback simple en mode non-rich
+                # Tout le tracé est composé puis rendu en un seul console.print(Group(...))
+                render = self.console.render_str  # str -> Text, comme console.print(str)
+                # Contexte sous les titres
+                out = [self._context_panel(day, ctx, sim_tot)]
+                # Rendu : côte-à-côte (24h) ou empilé (48h…)
+                if not stack_when_multi:
+                    # Concaténer ligne-à-ligne les deux grilles
+                    out.append(_title_cell(titles[0], 0) + Text(spacer) + _title_cell(titles[1], 0))
+                    out.append(self._join_lines([Text.assemble(l, Text(spacer), r) for l, r in zip(base_grid, sim_grid)]))
+                    out.append(Text(left_axis) + Text(spacer) + Text(right_axis))
+                    p1 = self._print_metrics_panel("Actuel", m_base, style="cyan")
+                    p2 = self._print_metrics_panel("Simulé", m_sim, style="magenta")
+                    # deux encarts côte à côte
+                    out.append(self._side_by_side_panels(p1, p2, col_width=2, gap=0))
+                else:
+                    # EMPILÉ (utile pour --days 2, etc.) : Actuel puis Simulé
+                    for title, grid, name, m, style in ((titles[0], base_grid, "Actuel", m_base, "cyan"),
+                                                        (titles[1], sim_grid,  "Simulé", m_sim,  "magenta")):
+                        out.append(_title_cell(title, 0))
+                        out.append(self._join_lines(grid))
+                        out.append(render(self._x_axis_bipolar(col_width, gap, hours=hours)))
+                        out.append(self._print_metrics_panel(name, m, style=style))
+                # Légende (une fois en bas)
+                out.append(render(
+                    "[dim]Haut : [orange1]PV direct[/], [magenta]Batt→charges[/], [blue]Import[/]   "
+                    "Bas : [#00BFFF]Grid→batterie[/], [yellow3]PV→batterie[/], [grey74]Export[/][/dim]"
+                ))
+                self.console.print(Group(*out))
+                return
+
+            # Rendu texte simple (sans Rich)
+            if not stack_when_multi:
+                self._print_lines([str(l) + spacer + str(r) for l, r in zip(base_grid, sim_grid)])
+                sys.stdout.write(left_axis + spacer + right_axis + "\n")
                 print(f"[Actuel] PV={m_base['pv']:.1f} kWh | Conso={m_base['load']:.1f} kWh | "
                       f"Import={m_base['imp']:.1f} | Export={m_base['exp']:.1f} | "
                       f"AC={m_base['ac']:.1f}% | TC={m_base['tc']:.1f}%")
                 print(f"[Simulé] PV={m_sim['pv']:.1f} kWh | Conso={m_sim['load']:.1f} kWh | "
                       f"Import={m_sim['imp']:.1f} | Export={m_sim['exp']:.1f} | "
                       f"AC={m_sim['ac']:.1f}% | TC={m_sim['tc']:.1f}%")
-        else:
-            # EMPILÉ (utile pour --days 2, etc.)
-            # --- Actuel ---
-            if self.has_rich:
-                self.console.print(_title_cell(titles[0], 0))
-            for line in base_grid:
-                if self.has_rich:
-                    self.console.print(line)
-                else:
-                    print(line)
-            self._print_x_axis_bipolar(col_width, gap, hours=hours)
-            m_base = self._metrics_from_rows(base_rows, report=True)
-            if self.has_rich:
-                p1 = self._print_metrics_panel("Actuel", m_base, style="cyan")
-                self.console.print(p1)
             else:
+                self._print_lines(base_grid)
+                self._print_x_axis_bipolar(col_width, gap, hours=hours)
                 print(f"[Actuel] PV={m_base['pv']:.1f} | Conso={m_base['load']:.1f} | Imp={m_base['imp']:.1f} | Exp={m_base['exp']:.1f} | AC={m_base['ac']:.1f}% | TC={m_base['tc']:.1f}%")
-
-            # --- Simulé ---
-            if self.has_rich:
-                self.console.print(_title_cell(titles[1], 0))
-            for line in sim_grid:
-                if self.has_rich:
-                    self.console.print(line)
-                else:
-                    print(line)
-            self._print_x_axis_bipolar(col_width, gap, hours=hours)
-            m_sim = self._metrics_from_rows(sim_rows, report=False)
-            if self.has_rich:
-                p2 = self._print_metrics_panel("Simulé", m_sim, style="magenta")
-                self.console.print(p2)
-            else:
+                self._print_lines(sim_grid)
+                self._print_x_axis_bipolar(col_width, gap, hours=hours)
                 print(f"[Simulé] PV={m_sim['pv']:.1f} | Conso={m_sim['load']:.1f} | Imp={m_sim['imp']:.1f} | Exp={m_sim['exp']:.1f} | AC={m_sim['ac']:.1f}% | TC={m_sim['tc']:.1f}%")
-       
-        # Légende (une fois en bas)
-        if self.has_rich:
-            self.console.print(
-                "[dim]Haut : [orange1]PV direct[/], [magenta]Batt→charges[/], [blue]Import[/]   "
-                "Bas : [#00BFFF]Grid→batterie[/], [yellow3]PV→batterie[/], [grey74]Export[/][/dim]"
-            )
 
     def show_day_not_found(self,
                            day: str,
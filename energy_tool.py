@@ -1,22 +1,33 @@
 #!/usr/bin/env python3
-import json, os, sys, ssl, csv, argparse
+import json, os, sys, csv, argparse, math
 from pathlib import Path
-import csv
-from pprint import pprint
-from sources.ha_ws_api import HAWebSocketSource
-from sources.csv_file_api import CSVSource
-from sources.enlighten_api import EnlightenSource  # prêt pour plus tard
+import numpy as np
+from typing import TYPE_CHECKING
 
 from cli_output import ConsoleUI
-from collections import defaultdict
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from datetime import datetime, timezone, tzinfo
 try:
     from zoneinfo import ZoneInfo  # Python 3.9+
 except ImportError:
     ZoneInfo = None
 
+try:
+    import orjson  # parseur JSON natif, lit directement les octets
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 LOCAL_TZ = ZoneInfo("Europe/Paris") if ZoneInfo else None
 
+if TYPE_CHECKING:
+    # sources importées à la demande dans `make_source` (websocket, requests, ...)
+    from sources.ha_ws_api import HAWebSocketSource
+    from sources.csv_file_api import CSVSource
+    from sources.enlighten_api import EnlightenSource  # prêt pour plus tard
+
 # =========================
 # CONFIG LOADER (JSON)
 # =========================
@@ -43,16 +54,39 @@ DEFAULTS = {
 
 ui = ConsoleUI()
 
+# nombre max de scénarios valides retenus et affichés par `run_simu`
+PASSING_LIMIT = 10
+
+@lru_cache(maxsize=1 << 15)
+def _to_iso_minute(s: str) -> str:
+    """
+    Normalise une date texte en "YYYY-MM-DD HH:MM" (résultat mis en cache :
+    les mêmes dates horaires reviennent pour chaque scénario écrit).
+
+    Args:
+        s (str): date ISO "YYYY-MM-DDTHH:MM:SS(Z?)" ou "YYYY-MM-DD HH:MM"
+    Returns:
+        str: date formatée
+    """
+    # normalise un ISO avec 'T' et secondes -> 'YYYY-MM-DD HH:MM'
+    if "T" in s:
+        try:
+            return datetime.fromisoformat(s.replace("Z","")).strftime("%Y-%m-%d %H:%M")
+        except Exception:
+            pass
+    return s[:16]  # tronque prudemment
+
 def save_sim_detail(csv_path: str, 
-                    sim_rows: list, 
-                    date_key: str = "date", 
+                    sim: dict, 
+                    dates: list, 
                     context: dict = None,
                     ) -> None:
     """
     Écrit un CSV horaire détaillé pour un scénario unique.
-    `sim_rows` est la liste de dicts renvoyée par `simulate_battery(...)`,
-    chaque élément devant contenir au minimum :
-        date, pv, load, pv_direct, pv_to_batt, batt_to_load, grid_to_batt, import, export, soc, context
+    `sim` est le dict de colonnes horaires (SIM_FIELDS) renvoyé par `simulate_battery(...)`,
+    avec les champs :
+        pv, load, pv_direct, pv_to_batt, batt_to_load, imp_grid, imp_load, import, export, soc
+    et `dates` la liste des dates horaires correspondantes
     où :
         context: ex. {
             "pv_factor": 2.4,
@@ -68,8 +102,8 @@ def save_sim_detail(csv_path: str,
 
     Args:
         csv_path (str): chemin du fichier CSV de sortie
-        sim_rows (list): liste des lignes horaires simulées
-        date_key (str, optional): clé pour la date dans chaque ligne. Defaults to "date".
+        sim (dict): colonnes horaires simulées {champ: ndarray}
+        dates (list): dates horaires (même longueur que `sim`)
         context (dict, optional): contexte à ajouter en méta. Defaults to None.
 
     Returns:
@@ -107,46 +141,39 @@ def save_sim_detail(csv_path: str,
         """
         if isinstance(dt, datetime):
             return dt.strftime("%Y-%m-%d %H:%M")
-        s = str(dt)
-        # normalise un ISO avec 'T' et secondes -> 'YYYY-MM-DD HH:MM'
-        if "T" in s:
-            try:
-                return datetime.fromisoformat(s.replace("Z","")).strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                pass
-        return s[:16]  # tronque prudemment
+        return _to_iso_minute(str(dt))
 
     ctx = context or {}
+    # colonnes lues une seule fois en floats Python (ordre de `fields`)
+    cols = [sim[k].tolist() for k in ("pv", "load", "pv_direct", "pv_to_batt", "batt_to_load",
+                                      "imp_grid", "imp_load", "import", "export", "soc")]
+    # meta répétées sur chaque ligne : lues une seule fois
+    meta = tuple(ctx.get(k) for k in meta_fields)
+    # fichier bufferisé (1 Mio), lignes positionnelles dans l'ordre de `all_fields`
+    with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(all_fields)
+        # `soc` accepté en kWh ou %, on écrit ce que la simu fournit
+        # 6 décimales formatées directement (pas de round() puis repr par valeur)
+        w.writerows(
+            (_fmt_date(dt),
+             f"{pv:.6f}",
+             f"{load:.6f}",
+             f"{pv_direct:.6f}",
+             f"{pv_to_batt:.6f}",
+             f"{batt_to_load:.6f}",
+             f"{imp_grid:.6f}",
+             f"{imp_load:.6f}",
+             f"{imp:.6f}",
+             f"{exp:.6f}",
+             f"{soc:.6f}") + meta
+            for (dt, pv, load, pv_direct, pv_to_batt, batt_to_load,
+                 imp_grid, imp_load, imp, exp, soc) in zip(dates, *cols)
+        )
 
-    with open(csv_path, "w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=all_fields)
-        w.writeheader()
-        for r in sim_rows:
-            row = {
-                "date": _fmt_date(r.get(date_key)),
-                "pv": round(float(r.get("pv", 0.0)), 6),
-                "load": round(float(r.get("load", 0.0)), 6),
-                "pv_direct": round(float(r.get("pv_direct", 0.0)), 6),
-                "pv_to_batt": round(float(r.get("pv_to_batt", 0.0)), 6),
-                "batt_to_load": round(float(r.get("batt_to_load", 0.0)), 6),
-                "grid_to_batt": round(float(r.get("imp_grid", 0.0)), 6),
-                "imp_to_load": round(float(r.get("imp_load", 0.0)), 6),
-                "import": round(float(r.get("import", 0.0)), 6),
-                "export": round(float(r.get("export", 0.0)), 6),
-                # `soc` accepté en kWh ou %, on écrit ce que la simu fournit
-                "soc": round(float(r.get("soc", 0.0)), 6),
-                # meta (répétées)
-                "pv_factor": ctx.get("pv_factor"),
-                "batt_kwh": ctx.get("batt_kwh"),
-                "eff": ctx.get("eff"),
-                "initial_soc": ctx.get("initial_soc"),
-                "pv_kwc": ctx.get("pv_kwc"),
-                "scenario": ctx.get("scenario"),
-            }
-            w.writerow(row)
-
+@lru_cache(maxsize=256)
 def to_utc_iso(s: str, 
-               tz_name: str = "Europe/Paris",
+               tz: "str | tzinfo" = "Europe/Paris",
                ) -> str:
     """
     Convertit une date fournie en LOCAL (sans offset) ou déjà tz-aware en ISO UTC.
@@ -158,11 +185,13 @@ def to_utc_iso(s: str,
         - Ex: None -> None
     Args:
         s (str): date en ISO locale ou tz-aware
-        tz_name (str, optional): nom de la timezone locale si `s` est naïf. Defaults to "Europe/Paris".
+        tz (str|tzinfo, optional): timezone locale si `s` est naïf, par nom ou déjà construite
+            (ex: ZoneInfo créée une fois par l'appelant). Defaults to "Europe/Paris".
     Returns:
         str: date en ISO UTC (avec 'Z'), ou chaîne vide si entrée vide
     Raises:
         RuntimeError: si `s` est naïf et zoneinfo indisponible
+    Note: résultat mis en cache par (s, tz), les bornes START/END reviennent souvent.
     """
     s = (s or "").strip()
     if not s:
@@ -174,37 +203,39 @@ def to_utc_iso(s: str,
         if not ZoneInfo:
             raise RuntimeError("zoneinfo indisponible : installe Python ≥ 3.9")
         dt = datetime.fromisoformat(s)
-        dt = dt.replace(tzinfo=ZoneInfo(tz_name))
+        dt = dt.replace(tzinfo=tz if isinstance(tz, tzinfo) else ZoneInfo(tz))
     dt_utc = dt.astimezone(timezone.utc)
     return dt_utc.isoformat().replace("+00:00", "Z")
 
-def aggregate_daily(sim_rows:list) -> dict:
+def _daily_sums(dates:list,
+                columns:list,
+                ) -> tuple:
     """
-    Agrège les résultats horaires en journalier.
-    Renvoie un dict { "YYYY-MM-DD": {pv, load, imp, exp, pv_direct, batt_to_load, pv_to_batt} }
+    Sommes journalières de colonnes horaires.
+    Série chronologique (cas normal) : les jours sont des plages contiguës, repérées aux
+    changements de jour, et sommées par np.add.reduceat (une passe C par colonne, sans tri).
+    Sinon : jours triés (np.unique) et réduction groupée np.add.at dans l'ordre d'origine.
 
     Args:
-        sim_rows (list): liste des lignes horaires simulées
+        dates (list): dates horaires ("YYYY-MM-DD ..."), le jour est pris sur 10 caractères
+        columns (list): colonnes horaires (ndarray) de même longueur que `dates`
     Returns:
-        dict: agrégation journalière
+        tuple: (jours triés list[str], liste des ndarray de sommes, une par colonne)
     """
-    day = defaultdict(lambda: {"pv":0.0,
-                                "load":0.0,
-                                "imp":0.0,
-                                "exp":0.0,
-                                "pv_direct":0.0,
-                                "batt_to_load":0.0,
-                                "pv_to_batt":0.0})
-    for r in sim_rows:
-        d = str(r["date"])[:10]
-        day[d]["pv"]           += r["pv"]
-        day[d]["load"]         += r["load"]
-        day[d]["imp"]          += r["import"]
-        day[d]["exp"]          += r["export"]
-        day[d]["pv_direct"]    += r.get("pv_direct", 0.0)
-        day[d]["batt_to_load"] += r.get("batt_to_load", 0.0)
-        day[d]["pv_to_batt"]   += r.get("pv_to_batt", 0.0)
-    return dict(sorted(day.items()))
+    # clé jour : conversion en "U10" = troncature à 10 caractères en une passe C
+    keys = np.array(dates, dtype="U10")
+    if keys.size and (keys[1:] >= keys[:-1]).all():
+        # jours croissants : début de plage à chaque changement de jour
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        return keys[starts].tolist(), [np.add.reduceat(np.asarray(col, dtype=np.float64), starts)
+                                       for col in columns]
+    days, inverse = np.unique(keys, return_inverse=True)
+    sums = []
+    for col in columns:
+        acc = np.zeros(len(days))
+        np.add.at(acc, inverse, col)
+        sums.append(acc)
+    return days.tolist(), sums
 
 def _as_float(x:any, name:str) -> float:
     """ 
@@ -239,6 +270,60 @@ def _as_list_float(x:list,
         raise ValueError(f"Paramètre '{name}' doit être une liste de nombres")
     return [float(v) for v in x]
 
+def _in_range(lo: float,
+              hi: float,
+              lo_open: bool = False,
+              ) -> callable:
+    """
+    Prédicat d'appartenance à un intervalle [lo,hi] (ou (lo,hi] si `lo_open`).
+
+    Args:
+        lo (float): borne basse
+        hi (float): borne haute (incluse)
+        lo_open (bool, optional): borne basse exclue. Defaults to False.
+    Returns:
+        callable: v -> bool
+    """
+    if lo_open:
+        return lambda v: lo < v <= hi
+    return lambda v: lo <= v <= hi
+
+# Règles de validation par clé, construites une seule fois à l'import :
+# (clé, prédicat sur la valeur, fin du message d'erreur). Les contrôles croisés
+# entre clés restent dans `run_report` / `run_simu`.
+_CFG_RULES = (
+    ("PV_ACTUAL_KW",              lambda v: v > 0,           "doit être > 0"),
+    ("TARGET_AC_MIN",             _in_range(0, 100),         "doit être dans [0,100]"),
+    ("TARGET_AC_MAX",             _in_range(0, 100),         "doit être dans [0,100]"),
+    ("TARGET_TC_MIN",             _in_range(0, 100),         "doit être dans [0,100]"),
+    ("BATTERY_EFF",               _in_range(0, 1, True),     "doit être dans (0,1]"),
+    ("BATTERY_SIZES",             bool,                      "doit contenir au moins une valeur"),
+    ("PV_FACTORS",                bool,                      "doit contenir au moins une valeur"),
+    ("INITIAL_SOC",               _in_range(0, 1),           "doit être dans [0,1]"),
+    ("BATT_MIN_SOC",              _in_range(0, 1),           "doit être dans [0,1]"),
+    ("BATT_MIN_SOC",              lambda v: v < 1.0,         "doit être < 1.0"),
+    ("MAX_DISCHARGE_KW_PER_HOUR", lambda v: v is None or v > 0, "doit être > 0"),
+    ("ALLOW_DISCHARGE_IN_HC",     lambda v: isinstance(v, bool), "doit être booléen (true/false)"),
+    ("GRID_CHARGE_IN_HC",         lambda v: isinstance(v, bool), "doit être booléen (true/false)"),
+    ("GRID_HOURS",                lambda v: isinstance(v, list) and all(isinstance(h,int) and 0<=h<=23 for h in v),
+                                  "doit être une liste d'entiers entre 0 et 23"),
+    ("GRID_TARGET_SOC",           _in_range(0, 1),           "doit être dans [0,1]"),
+    ("GRID_CHARGE_LIMIT",         lambda v: v > 0,           "doit être > 0"),
+)
+
+def _validate_cfg(cfg: dict) -> None:
+    """
+    Applique les règles `_CFG_RULES` (valeur absente → valeur de DEFAULTS).
+
+    Args:
+        cfg (dict): configuration chargée
+    Raises:
+        ValueError: à la première règle non respectée
+    """
+    for key, check, msg in _CFG_RULES:
+        if not check(cfg.get(key, DEFAULTS.get(key))):
+            raise ValueError(f"Le paramètre '{key}' {msg}")
+
 def load_config(path: Path) -> dict:
     """ 
     Charge la configuration JSON, applique les valeurs par défaut et vérifie les champs obligatoires.
@@ -254,7 +339,8 @@ def load_config(path: Path) -> dict:
     if not path.exists():
         print(f"[ERREUR] Fichier de config introuvable: {path.resolve()}")
         sys.exit(1)
-    cfg = json.loads(Path(path).read_text(encoding="utf-8"))
+    # octets bruts (UTF-8) : pas de décodage texte préalable
+    cfg = _json_loads(Path(path).read_bytes())
 
     # Obligatoires
     required = ["BASE_URL","TOKEN","PV_ENTITY","LOAD_ENTITY","START","END"]
@@ -279,6 +365,51 @@ def load_config(path: Path) -> dict:
     return cfg
 
 
+# contexte HTTPS par défaut déjà remplacé (SSL_VERIFY=false) : une seule fois par processus
+_SSL_PATCHED = False
+
+def _make_ha_ws_source(cfg: dict) -> "HAWebSocketSource":
+    """ Source Home Assistant (WebSocket), module importé à la demande. """
+    global _SSL_PATCHED
+    if not LOCAL_TZ:
+        raise RuntimeError("zoneinfo indisponible : installe Python ≥ 3.9")
+    if not cfg.get("SSL_VERIFY", False) and not _SSL_PATCHED:
+        import ssl  # seulement pour la source HA (WebSocket TLS)
+        ssl._create_default_https_context = ssl._create_unverified_context
+        _SSL_PATCHED = True
+        #ui.warning("La vérification SSL est désactivée (SSL_VERIFY=false)")
+    from sources.ha_ws_api import HAWebSocketSource
+    return HAWebSocketSource(
+        base_url=cfg["BASE_URL"],
+        token=cfg["TOKEN"],
+        pv_entity=cfg["PV_ENTITY"],
+        load_entity=cfg["LOAD_ENTITY"],
+        ssl_verify=cfg.get("SSL_VERIFY", False)
+    )
+
+def _make_csv_source(cfg: dict) -> "CSVSource":
+    """ Source fichier CSV, module importé à la demande. """
+    from sources.csv_file_api import CSVSource
+    return CSVSource(cfg["IN_CSV"])  # ajoutes "IN_CSV" dans ton JSON si tu veux
+
+def _make_enlighten_source(cfg: dict) -> "EnlightenSource":
+    """ Source Enphase Enlighten, module importé à la demande. """
+    from sources.enlighten_api import EnlightenSource
+    return EnlightenSource(
+        api_key=cfg["ENPHASE_API_KEY"],
+        user_id=cfg["ENPHASE_USER_ID"],
+        system_id=cfg["ENPHASE_SYSTEM_ID"],
+        site_id=cfg.get("ENPHASE_SITE_ID")
+    )
+
+# sources disponibles : nom (--source) → fabrique
+# seule la fabrique choisie importe son module et construit sa source
+_SOURCE_FACTORIES = {
+    "ha_ws":     _make_ha_ws_source,
+    "csv":       _make_csv_source,
+    "enlighten": _make_enlighten_source,
+}
+
 def make_source(cfg: dict,
                 args: argparse.Namespace = None,
                ) -> object:
@@ -293,29 +424,80 @@ def make_source(cfg: dict,
     Returns:
         object: instance de la source de données
     """
-    if args.source == "ha_ws":
-        return HAWebSocketSource(
-            base_url=cfg["BASE_URL"],
-            token=cfg["TOKEN"],
-            pv_entity=cfg["PV_ENTITY"],
-            load_entity=cfg["LOAD_ENTITY"],
-            ssl_verify=cfg.get("SSL_VERIFY", False)
-        )
-    elif args.source == "csv":
-        return CSVSource(cfg["IN_CSV"])  # ajoutes "IN_CSV" dans ton JSON si tu veux
-    elif args.source == "enlighten":
-        return EnlightenSource(
-            api_key=cfg["ENPHASE_API_KEY"],
-            user_id=cfg["ENPHASE_USER_ID"],
-            system_id=cfg["ENPHASE_SYSTEM_ID"],
-            site_id=cfg.get("ENPHASE_SITE_ID")
-        )
-    else:
-        raise ValueError(f"Source inconnue: {args.source}")
+    try:
+        factory = _SOURCE_FACTORIES[args.source]
+    except KeyError:
+        raise ValueError(f"Source inconnue: {args.source}") from None
+    return factory(cfg)
 
 # =========================
 # REPORT MODE
 # =========================
+def _write_hourly_report(csv_path: str,
+                         dates: list,
+                         pv_arr: np.ndarray,
+                         load_arr: np.ndarray,
+                         imp_arr: np.ndarray,
+                         exp_arr: np.ndarray,
+                         ) -> None:
+    """
+    Écrit le CSV horaire du rapport et sa copie binaire `<csv>.npz`
+    (colonnes relues par simu, cf. `load_hourly_csv` : pas de re-parsing du CSV).
+
+    Args:
+        csv_path (str): chemin du CSV horaire
+        dates (list): dates horaires
+        pv_arr, load_arr, imp_arr, exp_arr (np.ndarray): colonnes horaires
+    Returns:
+        None
+    """
+    with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(["date","pv_diff","load_diff","import","export"])
+        w.writerows(zip(dates, pv_arr.tolist(), load_arr.tolist(), imp_arr.tolist(), exp_arr.tolist()))
+    # Empreinte du CSV (taille, mtime ns) : la copie n'est valide que pour ce fichier exact
+    st = os.stat(csv_path)
+    npz_path = csv_path + ".npz"
+    tmp_path = npz_path + ".tmp"
+    # Écriture dans un fichier temporaire puis renommage atomique : jamais de .npz tronqué
+    with open(tmp_path, "wb") as f:
+        np.savez(f, dates=np.array(dates, dtype=str), pv=pv_arr, load=load_arr,
+                 csv_stat=np.array([st.st_size, st.st_mtime_ns], dtype=np.int64))
+    os.replace(tmp_path, npz_path)
+
+def _write_daily_report(csv_path: str,
+                        dates: list,
+                        pv_arr: np.ndarray,
+                        load_arr: np.ndarray,
+                        imp_arr: np.ndarray,
+                        exp_arr: np.ndarray,
+                        ) -> None:
+    """
+    Écrit le CSV journalier du rapport (sommes par jour, arrondies à 3 décimales).
+
+    Args:
+        csv_path (str): chemin du CSV journalier
+        dates (list): dates horaires
+        pv_arr, load_arr, imp_arr, exp_arr (np.ndarray): colonnes horaires
+    Returns:
+        None
+    """
+    # sommes groupées par jour (jours triés)
+    days, (pv_d, load_d, imp_d, exp_d) = _daily_sums(dates, [pv_arr, load_arr, imp_arr, exp_arr])
+    balance_d = pv_d - load_d
+
+    with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(["date","pv_day_kWh","load_day_kWh","import_kWh","export_kWh","balance_kWh"])
+        # jours déjà triés : colonnes parcourues en parallèle, sans dict par jour
+        w.writerows((d, round(pv,3), round(load,3), round(imp,3), round(exp,3), round(bal,3))
+                    for d, pv, load, imp, exp, bal in zip(days,
+                                                          pv_d.tolist(),
+                                                          load_d.tolist(),
+                                                          imp_d.tolist(),
+                                                          exp_d.tolist(),
+                                                          balance_d.tolist()))
+
 def run_report(cfg: dict,
                args: argparse.Namespace = None,
                ) -> None:
@@ -340,125 +522,81 @@ def run_report(cfg: dict,
         args.source = "ha_ws"
     if not args.source:
         args.source = "ha_ws"
-    if args.source not in ("ha_ws","csv","enlighten"):
-        raise ValueError(f"Source inconnue: {args.source}")
-    if args.source == "csv" and not cfg.get("IN_CSV"):
+    source = args.source
+    get = cfg.get
+    if source not in ("ha_ws","csv","enlighten"):
+        raise ValueError(f"Source inconnue: {source}")
+    if source == "csv" and not get("IN_CSV"):
         raise ValueError("Pour la source 'csv', le paramètre 'IN_CSV' doit être fourni dans la config")
-    if args.source == "enlighten":
+    if source == "enlighten":
         for k in ("ENPHASE_API_KEY","ENPHASE_USER_ID","ENPHASE_SYSTEM_ID"):
-            if not cfg.get(k):
+            if not get(k):
                 raise ValueError(f"Pour la source 'enlighten', le paramètre '{k}' doit être fourni dans la config")
-    if not cfg.get("OUT_CSV_DETAIL"):
+
+    # Paramètres courants (lus une fois, réutilisés par les contrôles et la suite)
+    START = get("START")
+    END = get("END")
+    OUT_CSV_DETAIL = get("OUT_CSV_DETAIL")
+    OUT_CSV_DAILY = get("OUT_CSV_DAILY")
+    PV_ACTUAL_KW = get("PV_ACTUAL_KW")
+
+    if not OUT_CSV_DETAIL:
         raise ValueError("Le paramètre 'OUT_CSV_DETAIL' doit être fourni dans la config")
-    if not cfg.get("OUT_CSV_DAILY"):
+    if not OUT_CSV_DAILY:
         raise ValueError("Le paramètre 'OUT_CSV_DAILY' doit être fourni dans la config")
-    if not cfg.get("START") or not cfg.get("END"):
+    if not START or not END:
         raise ValueError("Les paramètres 'START' et 'END' doivent être fournis dans la config")
-    if not cfg.get("PV_ACTUAL_KW"):
+    if not PV_ACTUAL_KW:
         raise ValueError("Le paramètre 'PV_ACTUAL_KW' doit être fourni dans la config")
-    if cfg["PV_ACTUAL_KW"] <= 0:
-        raise ValueError("Le paramètre 'PV_ACTUAL_KW' doit être > 0")
-    if cfg["TARGET_AC_MIN"] < 0 or cfg["TARGET_AC_MIN"] > 100:
-        raise ValueError("Le paramètre 'TARGET_AC_MIN' doit être dans [0,100]")
-    if cfg["TARGET_AC_MAX"] < 0 or cfg["TARGET_AC_MAX"] > 100:
-        raise ValueError("Le paramètre 'TARGET_AC_MAX' doit être dans [0,100]")
+    # bornes et types clé par clé (table `_CFG_RULES`), puis contrôles croisés
+    _validate_cfg(cfg)
+    initial_soc = cfg["INITIAL_SOC"]
+    min_soc = cfg["BATT_MIN_SOC"]
+    grid_soc = cfg["GRID_TARGET_SOC"]
+    grid_charge = cfg["GRID_CHARGE_IN_HC"]
     if cfg["TARGET_AC_MIN"] > cfg["TARGET_AC_MAX"]:
         raise ValueError("Le paramètre 'TARGET_AC_MIN' doit être ≤ 'TARGET_AC_MAX'")
-    if cfg["TARGET_TC_MIN"] < 0 or cfg["TARGET_TC_MIN"] > 100:
-        raise ValueError("Le paramètre 'TARGET_TC_MIN' doit être dans [0,100]")
-    if cfg["BATTERY_EFF"] <= 0 or cfg["BATTERY_EFF"] > 1:
-        raise ValueError("Le paramètre 'BATTERY_EFF' doit être dans (0,1]")
-    if not cfg["BATTERY_SIZES"]:
-        raise ValueError("Le paramètre 'BATTERY_SIZES' doit contenir au moins une valeur")
-    if not cfg["PV_FACTORS"]:
-        raise ValueError("Le paramètre 'PV_FACTORS' doit contenir au moins une valeur")
-    if cfg["INITIAL_SOC"] < 0 or cfg["INITIAL_SOC"] > 1:
-        raise ValueError("Le paramètre 'INITIAL_SOC' doit être dans [0,1]")
-    if cfg["BATT_MIN_SOC"] < 0 or cfg["BATT_MIN_SOC"] > 1:
-        raise ValueError("Le paramètre 'BATT_MIN_SOC' doit être dans [0,1]")
-    if cfg["BATT_MIN_SOC"] >= 1.0:
-        raise ValueError("Le paramètre 'BATT_MIN_SOC' doit être < 1.0")
-    if cfg["BATT_MIN_SOC"] >= cfg["INITIAL_SOC"]:
+    if min_soc >= initial_soc:
         raise ValueError("Le paramètre 'BATT_MIN_SOC' doit être < 'INITIAL_SOC'")
-    if cfg["MAX_DISCHARGE_KW_PER_HOUR"] <= 0:
-        raise ValueError("Le paramètre 'MAX_DISCHARGE_KW_PER_HOUR' doit être > 0")
-    if not isinstance(cfg["ALLOW_DISCHARGE_IN_HC"], bool):
-        raise ValueError("Le paramètre 'ALLOW_DISCHARGE_IN_HC' doit être booléen (true/false)")
-    if not isinstance(cfg["GRID_CHARGE_IN_HC"], bool):  
-        raise ValueError("Le paramètre 'GRID_CHARGE_IN_HC' doit être booléen (true/false)")
-    if not isinstance(cfg["GRID_HOURS"], list) or not all(isinstance(h,int) and 0<=h<=23 for h in cfg["GRID_HOURS"]):
-        raise ValueError("Le paramètre 'GRID_HOURS' doit être une liste d'entiers entre 0 et 23")
-    if cfg["GRID_TARGET_SOC"] < 0 or cfg["GRID_TARGET_SOC"] > 1:
-        raise ValueError("Le paramètre 'GRID_TARGET_SOC' doit être dans [0,1]")
-    if cfg["GRID_CHARGE_LIMIT"] <= 0:
-        raise ValueError("Le paramètre 'GRID_CHARGE_LIMIT' doit être > 0")
-    if cfg["GRID_TARGET_SOC"] <= cfg["BATT_MIN_SOC"]:
+    if grid_soc <= min_soc:
         raise ValueError("Le paramètre 'GRID_TARGET_SOC' doit être > 'BATT_MIN_SOC'")
-    if cfg["GRID_CHARGE_IN_HC"] and not cfg["GRID_HOURS"]:
+    if grid_charge and not cfg["GRID_HOURS"]:
         raise ValueError("Si 'GRID_CHARGE_IN_HC' est true, 'GRID_HOURS' doit contenir au moins une heure")
-    if cfg["GRID_CHARGE_IN_HC"] and cfg["GRID_TARGET_SOC"] <= cfg["INITIAL_SOC"]:
+    if grid_charge and grid_soc <= initial_soc:
         raise ValueError("Si 'GRID_CHARGE_IN_HC' est true, 'GRID_TARGET_SOC' doit être > 'INITIAL_SOC'")
-    if not LOCAL_TZ and (not args.source or args.source == "ha_ws"):
-        raise RuntimeError("zoneinfo indisponible : installe Python ≥ 3.9")
-    if args.source == "ha_ws" and not cfg.get("SSL_VERIFY", False):
-        ssl._create_default_https_context = ssl._create_unverified_context
-        #ui.warning("La vérification SSL est désactivée (SSL_VERIFY=false)")
-
-    # Paramètres courants
-    START = cfg["START"]
-    END = cfg["END"]
-    OUT_CSV_DETAIL = cfg["OUT_CSV_DETAIL"]
-    OUT_CSV_DAILY = cfg["OUT_CSV_DAILY"]
-    PV_ACTUAL_KW = cfg["PV_ACTUAL_KW"]
 
     # 1) collecte via source
     src = make_source(cfg, args)
-    tz_name = cfg.get("TZ_NAME", "Europe/Paris")
-    start_utc = to_utc_iso(cfg["START"], tz_name)
-    end_utc   = to_utc_iso(cfg["END"],   tz_name)
+    # timezone construite une seule fois pour les deux bornes
+    tz = get("TZ_NAME", "Europe/Paris")
+    if ZoneInfo:
+        tz = ZoneInfo(tz)
+    start_utc = to_utc_iso(START, tz)
+    end_utc   = to_utc_iso(END,   tz)
     series = src.get_hourly_pv_load(start_utc, end_utc)
 
     #all_hours = sorted(set(pv_hour) | set(load_hour))
-    rows = []
-    for h in series:
-        pv, ld = h["pv"], h["load"]
-        self_used = min(pv, ld)
-        export = max(0.0, pv - self_used)
-        imp    = max(0.0, ld - self_used)
-        rows.append({"date": h["date"],
-                     "pv_diff": pv,
-                     "load_diff": ld,
-                     "import": imp,
-                     "export": export})
-
-    # CSV horaire
-    with open(OUT_CSV_DETAIL, "w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=["date","pv_diff","load_diff","import","export"])
-        w.writeheader(); w.writerows(rows)
-
-    # CSV journalier
-    daily = {}
-    for r in rows:
-        d = r["date"][:10]
-        if d not in daily:
-            daily[d] = {"pv":0.0,"load":0.0,"imp":0.0,"exp":0.0}
-        daily[d]["pv"]   += r["pv_diff"]
-        daily[d]["load"] += r["load_diff"]
-        daily[d]["imp"]  += r["import"]
-        daily[d]["exp"]  += r["export"]
-
-    with open(OUT_CSV_DAILY, "w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(["date","pv_day_kWh","load_day_kWh","import_kWh","export_kWh","balance_kWh"])
-        for d in sorted(daily):
-            pv   = daily[d]["pv"]; load = daily[d]["load"]
-            imp  = daily[d]["imp"]; exp  = daily[d]["exp"]
-            w.writerow([d, round(pv,3), round(load,3), round(imp,3), round(exp,3), round(pv-load,3)])
-
-    pv_tot = sum(r["pv_diff"] for r in rows)
-    load_tot = sum(r["load_diff"] for r in rows)
-    imp_tot = sum(r["import"] for r in rows)
-    exp_tot = sum(r["export"] for r in rows)
+    # colonnes horaires : import/export calculés en une passe vectorisée
+    n = len(series)
+    dates = [h["date"] for h in series]
+    pv_arr = np.fromiter((h["pv"] for h in series), dtype=np.float64, count=n)
+    load_arr = np.fromiter((h["load"] for h in series), dtype=np.float64, count=n)
+    # différence signée : export = max(diff,0), import = export - diff (= max(-diff,0), sans -0.0)
+    diff = pv_arr - load_arr
+    exp_arr = np.maximum(diff, 0.0)
+    imp_arr = exp_arr - diff
+
+    # CSV horaire (+ copie .npz) écrit dans un thread pendant l'agrégation journalière
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        hourly_job = pool.submit(_write_hourly_report, OUT_CSV_DETAIL, dates, pv_arr, load_arr, imp_arr, exp_arr)
+        _write_daily_report(OUT_CSV_DAILY, dates, pv_arr, load_arr, imp_arr, exp_arr)
+        hourly_job.result()  # propage une éventuelle erreur d'écriture
+
+    # totaux : une réduction par colonne
+    pv_tot = float(pv_arr.sum())
+    load_tot = float(load_arr.sum())
+    imp_tot = float(imp_arr.sum())
+    exp_tot = float(exp_arr.sum())
     pv_used = pv_tot - exp_tot
     ac = (pv_used / pv_tot * 100) if pv_tot>0 else 0
     tc = (pv_used / load_tot * 100) if load_tot>0 else 0
@@ -477,13 +615,28 @@ def run_report(cfg: dict,
 # =========================
 # SIMULATION MODE
 # =========================
-def compute_stats(rows:list) -> dict:
+# Résultat horaire d'une simulation : un dict {champ: ndarray float64} (une colonne contiguë
+# par champ), les dates étant partagées entre toutes les combinaisons (pas de copie par heure)
+SIM_FIELDS = (
+    "pv",
+    "load",
+    "export",
+    "import",
+    "soc",
+    "pv_direct",
+    "batt_to_load",
+    "pv_to_batt",
+    "imp_grid",
+    "imp_load",
+)
+
+def compute_stats(sim:dict) -> dict:
     """
-    Calcule les statistiques globales sur une liste de lignes horaires
-    contenant au minimum 'pv' et 'load', optionnellement 'export' et 'import'.
+    Calcule les statistiques globales sur les colonnes horaires (SIM_FIELDS)
+    renvoyées par `simulate_battery(...)` : champs 'pv', 'load', 'export' et 'import'.
 
     Args:
-        rows (list): liste des lignes horaires [{'date', 'pv', 'load', 'export'?, 'import'?}]
+        sim (dict): colonnes horaires {champ: ndarray}
     Returns:
         dict: {pv_tot, load_tot, import_tot, export_tot, ac, tc}
     where:
@@ -494,12 +647,49 @@ def compute_stats(rows:list) -> dict:
             ac          : autoconsommation (%)
             tc          : taux de couverture (%)
     """
+    # une réduction par colonne, sans parcourir de dicts horaires
+    return _stats_from_totals(float(sim["pv"].sum()),
+                              float(sim["load"].sum()),
+                              float(sim["import"].sum()),
+                              float(sim["export"].sum()))
+
+def _no_battery_stats(pv_arr: np.ndarray,
+                      load_arr: np.ndarray,
+                      ) -> dict:
+    """
+    Statistiques globales sans batterie (cf. `compute_stats`), directement sur les colonnes :
+    PV consommée directement = min(pv, load), le reste est exporté / importé.
+
+    Args:
+        pv_arr (np.ndarray): production PV horaire (kWh)
+        load_arr (np.ndarray): consommation horaire (kWh)
+    Returns:
+        dict: {pv_tot, load_tot, import_tot, export_tot, ac, tc}
+    """
+    pv_direct = np.minimum(pv_arr, load_arr)
+    return _stats_from_totals(float(pv_arr.sum()),
+                              float(load_arr.sum()),
+                              float((load_arr - pv_direct).sum()),
+                              float((pv_arr - pv_direct).sum()))
+
+def _stats_from_totals(pv: float,
+                       load: float,
+                       imp: float,
+                       exp: float,
+                       ) -> dict:
+    """
+    Finalise les statistiques (cf. `compute_stats`) à partir des totaux déjà sommés.
+
+    Args:
+        pv (float): production PV totale (kWh)
+        load (float): consommation totale (kWh)
+        imp (float): import total (kWh)
+        exp (float): export total (kWh)
+    Returns:
+        dict: {pv_tot, load_tot, import_tot, export_tot, ac, tc}
+    """
     eps = 1e-9
 
-    pv = sum(r["pv"] for r in rows)
-    load = sum(r["load"] for r in rows)
-    exp = sum(r.get("export",0.0) for r in rows)
-    imp = sum(r.get("import",0.0) for r in rows)
     # PV réellement utilisé par le foyer (direct + via batterie)
     pv_used = max(0.0, pv - exp)
     onsite  = max(load - imp, 0.0)
@@ -523,22 +713,6 @@ def compute_stats(rows:list) -> dict:
             "ac":ac,
             "tc":tc}
 
-def simulate_pv_scale(rows:list,
-                      factor:float,
-                      ) -> list:
-    """ 
-    Renvoie une nouvelle liste de rows avec la production PV multipliée par `factor`.
-
-    Args:
-        rows (list): liste des lignes horaires [{'date', 'pv', 'load'}]
-        factor (float): facteur de multiplication de la production PV
-    Returns:
-        list: nouvelles lignes avec PV ajustée
-    """
-    return [{"date": r["date"],
-             "pv": r["pv"]*factor,
-             "load": r["load"]} for r in rows]
-
 def _hour_from_iso(ts_str: str) -> int:
     """
     Extrait l'heure locale (0-23) d'une chaîne de caractères ISO "YYYY-MM-DDTHH:MM:SS(+TZ?)"
@@ -561,19 +735,237 @@ def _hour_from_iso(ts_str: str) -> int:
     8. "2025-06-01T14:30:00.123456+02:00" -> 14
     9. "2025-06-01T14:30:00.123456Z" -> 14
     10. "2025-06-01 14:30:00" -> 14
+    11. "2025-01-01T03:00:00Z" -> 3 (y compris Python 3.10 : "Z" normalisé en "+00:00")
     """
     try:
-        # "YYYY-MM-DD HH:MM" ou ISO "YYYY-MM-DDTHH:MM:SS(+TZ?)"
-        s = str(ts_str).replace("T", " ")
-        if "+" in s: s = s.split("+", 1)[0]
-        if "Z" in s: s = s.replace("Z", "")
-        return int(s[11:13])
+        # "YYYY-MM-DD HH:MM" ou ISO "YYYY-MM-DDTHH:MM:SS(+TZ?)" : parseur C de datetime,
+        # l'heure lue est celle écrite (pas de conversion de fuseau)
+        s = str(ts_str)
+        if len(s) < 13:
+            return -1  # date seule : pas d'heure
+        # "Z" final refusé par fromisoformat avant Python 3.11
+        s = s.replace("Z", "+00:00")
+        try:
+            return datetime.fromisoformat(s).hour
+        except ValueError:
+            # formats refusés par fromisoformat en 3.10 (ex. fraction < 6 chiffres) : HH brut
+            return int(s[11:13])
     except Exception:
         return -1
 
-def simulate_battery(rows, 
+def _hc_mask(dates: list,
+             grid_hours: list,
+             ) -> np.ndarray:
+    """
+    Masque horaire des heures creuses : True si l'heure locale de la date est dans `grid_hours`.
+    Ne dépend que des dates : calculé une fois et partagé entre toutes les simulations.
+
+    Args:
+        dates (list): dates horaires ISO
+        grid_hours (list): heures creuses [0..23]
+    Returns:
+        np.ndarray: booléens, un par date (False si l'heure est indéterminée)
+    """
+    # table des 24 heures (HC ou non) : une lecture indexée par date au lieu d'un `in` sur un set
+    grid_mask = np.zeros(24, dtype=np.bool_)
+    grid_mask[[h for h in (grid_hours or []) if 0 <= h <= 23]] = True
+    hours = np.fromiter(map(_hour_from_iso, dates), dtype=np.int8, count=len(dates))
+    # heure indéterminée (-1) : jamais en HC
+    return (hours >= 0) & grid_mask[hours]
+
+def _sim_batt_kernel(pv_in,
+                     load_in,
+                     hc_in,
+                     pv_factor,
                      batt_kwh,
                      eff,
+                     soc_min,
+                     soc_max,
+                     soc_init,
+                     charge_limit,
+                     discharge_limit,
+                     grid_charge,
+                     grid_target_soc,
+                     grid_charge_limit,
+                     allow_discharge_in_hc,
+                     allow_export,
+                     store,
+                     export_out,
+                     import_out,
+                     soc_out,
+                     pv_direct_out,
+                     batt_to_load_out,
+                     pv_to_batt_out,
+                     imp_grid_out,
+                     imp_load_out,
+                     ) -> None:
+    """
+    Noyau horaire de `simulate_battery` : boucle scalaire pure (compilable par numba).
+    Les limites "illimitées" sont codées par math.inf (pas de None en code compilé) :
+    `min(x, inf)` vaut x, aucune branche par heure.
+    Les colonnes `*_out` sont préallouées par l'appelant et remplies en place.
+
+    Args:
+        pv_in, load_in: production et consommation horaires (kWh)
+        hc_in: booléen par heure, True si l'heure est en HC
+        pv_factor: facteur appliqué à la PV à la lecture (pas de tableau mis à l'échelle)
+        batt_kwh, eff, soc_min, soc_max, soc_init: paramètres batterie (kWh / rendement)
+        charge_limit, discharge_limit: limites horaires (kW), math.inf = illimité
+        grid_charge, grid_target_soc, grid_charge_limit: recharge réseau en HC
+        allow_discharge_in_hc, allow_export: autorisations
+        store: remplir les colonnes `*_out` (False : seuls les totaux sont calculés)
+        *_out: colonnes de sortie (même longueur que `pv_in`, ignorées si `store` est False)
+    Returns:
+        tuple: totaux (pv, load, import, export) sommés heure par heure dans la boucle
+    """
+    # invariants de l'appel, sortis de la boucle horaire
+    # (division conservée plutôt qu'un 1/eff : résultats identiques au bit près)
+    # min/max écrits en expressions conditionnelles (mêmes résultats que min()/max() :
+    # pas d'appel de fonction en Python, minsd/maxsd sans branche une fois compilé)
+    eff_div = eff if eff > 0 else 1.0
+    # cible de SoC côté batterie pour la recharge réseau en HC
+    target_soc = batt_kwh * max(0.0, min(1.0, grid_target_soc))
+    # puissance de recharge réseau (kWh par heure), jamais négative
+    grid_in_limit = max(0.0, grid_charge_limit)
+    soc = soc_init
+    # totaux cumulés pendant la boucle : pas de seconde passe sur les colonnes
+    pv_tot = 0.0
+    load_tot = 0.0
+    imp_tot = 0.0
+    exp_tot = 0.0
+    for i in range(len(pv_in)):
+        pv = pv_in[i] * pv_factor
+        load = load_in[i]
+        # 0) HC pré-calculée par heure (False si l'heure est indéterminée)
+        in_hc = hc_in[i]
+        allow_charge_in_hc = grid_charge and in_hc
+
+        available_pv = pv
+        remaining_load = load
+        
+        pv_direct      = 0.0
+        pv_to_batt     = 0.0
+        batt_to_load   = 0.0
+        imp_load       = 0.0
+        imp_grid       = 0.0
+        
+        # 1) PV → charges direct
+        pv_direct = remaining_load if remaining_load < available_pv else available_pv
+        available_pv   -= pv_direct
+        remaining_load -= pv_direct
+
+        # 2) PV -> batterie (stockage) limité par capacité restante + limite horaire
+        pv_in_limit = charge_limit if charge_limit < available_pv else available_pv
+        # énergie pouvant être stockée côté batterie
+        can_store_in = (soc_max - soc) / eff_div  # kWh côté entrée PV
+        # énergie effectivement stockée côté PV
+        can_store_in = can_store_in if can_store_in > 0.0 else 0.0
+        pv_to_batt = can_store_in if can_store_in < pv_in_limit else pv_in_limit
+        # Charge effective côté batterie = pv_to_batt * eff
+        if pv_to_batt > 0:
+            soc += pv_to_batt * eff
+            available_pv -= pv_to_batt
+
+        # 3) Batterie -> load (décharge), y compris en HC si autorisée
+        #    Par défaut : en HC, bloquée si allow_discharge_in_hc=False
+        #    Cas particulier demandé : si la recharge réseau est active (HC + grid_charge),
+        #    la décharge est bloquée pour cette heure (priorité à la recharge) : décidé ici,
+        #    avant la décharge, il n'y a donc jamais de décharge à annuler à l'étape 6
+        batt_out_limit = discharge_limit if discharge_limit < remaining_load else remaining_load
+        can_discharge_now = not in_hc or (allow_discharge_in_hc and not grid_charge)
+        if batt_out_limit > 0 and can_discharge_now:
+            # énergie disponible pour décharge côté batterie
+            batt_can_out = soc - soc_min # kWh *côté batterie*
+            batt_can_out = batt_can_out if batt_can_out > 0.0 else 0.0
+            # énergie restituée au load = retiré_du_SoC * eff
+            batt_to_load = batt_can_out * eff
+            batt_to_load = batt_to_load if batt_to_load < batt_out_limit else batt_out_limit
+            # mise à jour SoC
+            if batt_to_load > 0:
+                # côté batterie, il faut retirer plus pour compenser le rendement
+                soc -= batt_to_load / eff_div
+                # mise à jour load restant
+                remaining_load -= batt_to_load
+
+        # 4) Le reste du load est à importer
+        imp_load = remaining_load if remaining_load > 0.0 else 0.0
+
+        # 5) Surplus PV restant = export si autorisé
+        if allow_export:
+            export = available_pv if available_pv > 0.0 else 0.0
+        else:
+            # forcer l'export à 0 : le surplus PV non utilisé est perdu
+            export = 0.0
+        
+        # 6) Charge réseau en HC pour atteindre la cible (séparée du load)
+        imp_grid = 0.0
+        # Prioriser la recharge réseau uniquement si on est en HC
+        # et si la cible est supérieure au SoC actuel
+        if allow_charge_in_hc:
+            # ne recharger que si la cible est supérieure au SoC actuel
+            if soc < target_soc:
+                # énergie nécessaire pour atteindre la cible côté batterie
+                need_batt_side = target_soc - soc                              # kWh côté batterie
+                # énergie nécessaire côté réseau (avant rendement)
+                grid_in = need_batt_side / eff_div                             # kWh côté réseau
+                grid_in = grid_in if grid_in < grid_in_limit else grid_in_limit
+                # limiter à la capacité restante côté batterie
+                if grid_in > 0:
+                    soc += grid_in * eff
+                    imp_grid += grid_in
+
+        # 7) Clamp SoC
+        soc = soc if soc < soc_max else soc_max
+        soc = soc if soc > soc_min else soc_min
+
+        # 8) Import total = load + recharge HC
+        #    Export total = surplus PV
+        #    (la batterie est un tampon interne)
+        imp = imp_load + imp_grid
+
+        pv_tot   += pv
+        load_tot += load
+        imp_tot  += imp
+        exp_tot  += export
+        if store:
+            export_out[i]       = export
+            import_out[i]       = imp
+            soc_out[i]          = soc
+            pv_direct_out[i]    = pv_direct
+            batt_to_load_out[i] = batt_to_load
+            pv_to_batt_out[i]   = pv_to_batt
+            imp_grid_out[i]     = imp_grid
+            imp_load_out[i]     = imp_load
+    return pv_tot, load_tot, imp_tot, exp_tot
+
+# noyau de simulation résolu au premier appel : (fonction, compilée?)
+_SIM_KERNEL = None
+
+def _get_sim_kernel() -> tuple:
+    """
+    Renvoie le noyau horaire de simulation, compilé avec numba si disponible.
+    numba est importé à la demande : les modes report/plot n'en paient pas le coût.
+    `nogil=True` permet de lancer plusieurs simulations en parallèle sur des threads.
+    Pas de `fastmath` : les résultats restent identiques à la version Python.
+
+    Returns:
+        tuple: (noyau, True si compilé par numba)
+    """
+    global _SIM_KERNEL
+    if _SIM_KERNEL is None:
+        try:
+            from numba import njit
+            _SIM_KERNEL = (njit(cache=True, nogil=True, boundscheck=False)(_sim_batt_kernel), True)
+        except ImportError:
+            _SIM_KERNEL = (_sim_batt_kernel, False)
+    return _SIM_KERNEL
+
+def simulate_battery(pv_arr,
+                     load_arr,
+                     dates,
+                     batt_kwh,
+                     eff,
+                     pv_factor=1.0,
                      charge_limit=None, 
                      discharge_limit=None,
                      grid_charge=False, 
@@ -584,14 +976,19 @@ def simulate_battery(rows,
                      initial_soc=0.0,
                      allow_discharge_in_hc=True,
                      allow_export=True,
-                     ) -> list:
+                     hc_mask=None,
+                     return_detail=True,
+                     ) -> dict:
     """
     Simule l'utilisation d'une batterie sur une période entière
     en partant d'un SoC initial, sans remise à zéro quotidienne.
 
-        rows                    : liste des mesures horaires [{'date', 'pv', 'load'}]
+        pv_arr                  : production PV horaire (ndarray, kWh)
+        load_arr                : consommation horaire (ndarray, kWh)
+        dates                   : dates horaires correspondantes (même longueur)
         batt_kwh                : capacité totale de la batterie (kWh)
         eff                     : rendement de charge/décharge (0-1)
+        pv_factor               : facteur multiplicatif de la production PV (1.0 = actuel)
         initial_soc             : fraction initiale de charge (0.0 → 0%, 1.0 → 100%)
         soc_reserve             : pourcentage minimal de SoC non déchargeable
         grid_charge             : autoriser la recharge sur le réseau en heures creuses
@@ -602,10 +999,14 @@ def simulate_battery(rows,
         charge_limit            : puissance max de charge batterie (kW) (None = illimité)
         discharge_limit         : puissance max de décharge batterie (kW) (None = illimité)
         allow_export            : autoriser l'export vers le réseau (True/False)
+        hc_mask                 : masque HC pré-calculé par `_hc_mask(dates, grid_hours)` (None = calculé ici)
+        return_detail           : False → seules les statistiques globales sont renvoyées
+                                  (totaux cumulés dans la boucle, aucune colonne horaire écrite)
     Returns:
-        list: liste des lignes horaires avec simulation batterie
-        chaque élément contient au minimum :
-            date, pv, load, pv_direct, pv_to_batt, batt_to_load, import, export, soc
+        dict: si `return_detail` est False, statistiques globales (cf. `compute_stats`)
+        dict: sinon, colonnes horaires {champ: ndarray} de la longueur de `pv_arr`,
+        une valeur par heure (les dates restent dans `dates`) pour les champs (SIM_FIELDS) :
+            pv, load, pv_direct, pv_to_batt, batt_to_load, imp_grid, imp_load, import, export, soc
         où :
             pv              : production PV (kWh)
             load            : consommation (kWh)
@@ -615,6 +1016,8 @@ def simulate_battery(rows,
             import         : énergie importée du réseau (kWh)
             export         : énergie exportée vers le réseau (kWh)
             soc            : état de charge de la batterie (kWh)
+            imp_grid       : import réseau pour recharger la batterie en HC (kWh)
+            imp_load       : import réseau pour alimenter le load (kWh)
         Si `batt_kwh` <= 0, la batterie n'est pas simulée et les valeurs de SoC, pv_to_batt et batt_to_load sont à 0.
         Le calcul d'import/export est ajusté en conséquence.
         Le SoC est maintenu entre [batt_kwh * soc_reserve, batt_kwh].
@@ -630,7 +1033,7 @@ def simulate_battery(rows,
         La période de simulation doit idéalement être horaire (1 heure entre chaque ligne).
     Voir les exemples ci-dessous pour d'autres durées.
         Le calcul d'import/export prend en compte la batterie et les recharges réseau en HC.
-    Note: les valeurs de `pv` et `load` dans `rows` sont considérées comme des énergies (kWh) sur la période horaire.
+    Note: les valeurs de `pv_arr` et `load_arr` sont considérées comme des énergies (kWh) sur la période horaire.
     Note: si la période n'est pas exactement horaire, les valeurs sont considérées comme des énergies sur la période donnée.
     Note: les valeurs de puissance (kW) sont considérées comme des énergies (kWh) sur une période horaire.
     1 kW sur 1 heure = 1 kWh
@@ -656,21 +1059,21 @@ def simulate_battery(rows,
     Exemples d'utilisation:
     -------------------------------------------------------------------------------------------
     # Simule une batterie de 10 kWh avec un rendement de 90% et un SoC initial de 50%
-    simulated = simulate_battery(data, batt_kwh=10, eff=0.9, initial_soc=0.5) # 50% de SoC initial
+    simulated = simulate_battery(pv, load, dates, batt_kwh=10, eff=0.9, initial_soc=0.5) # 50% de SoC initial
     # Simule une batterie de 20 kWh avec un rendement de 85%, un SoC initial de 20%,
     # une limite de charge de 5 kW, une limite de décharge de 5 kW, et une réserve de SoC de 10%
-    simulated = simulate_battery(data, batt_kwh=20, eff=0.85, initial_soc=0.2, charge_limit=5, discharge_limit=5, soc_reserve=0.1)
+    simulated = simulate_battery(pv, load, dates, batt_kwh=20, eff=0.85, initial_soc=0.2, charge_limit=5, discharge_limit=5, soc_reserve=0.1)
     # Simule une batterie de 15 kWh avec un rendement de 90%, un SoC initial de 0%,
     # autorise la recharge sur le réseau en heures creuses (22h-6h) avec une cible de SoC de 80% et une limite de charge réseau de 3 kW
-    simulated = simulate_battery(data, batt_kwh=15, eff=0.9, initial_soc=0.0, grid_charge=True, grid_hours=list(range(22,24))+list(range(0,6)), grid_target_soc=0.8, grid_charge_limit=3.0)
+    simulated = simulate_battery(pv, load, dates, batt_kwh=15, eff=0.9, initial_soc=0.0, grid_charge=True, grid_hours=list(range(22,24))+list(range(0,6)), grid_target_soc=0.8, grid_charge_limit=3.0)
     # Simule une batterie de 10 kWh avec un rendement de 90%, un SoC initial de 50%,
     # interdit la décharge en heures creuses, autorise la recharge sur le réseau en heures creuses (22h-6h)
-    simulated = simulate_battery(data, batt_kwh=10, eff=0.9, initial_soc=0.5, allow_discharge_in_hc=False, grid_charge=True, grid_hours=list(range(22,24))+list(range(0,6)), grid_target_soc=0.8, grid_charge_limit=3.0)
+    simulated = simulate_battery(pv, load, dates, batt_kwh=10, eff=0.9, initial_soc=0.5, allow_discharge_in_hc=False, grid_charge=True, grid_hours=list(range(22,24))+list(range(0,6)), grid_target_soc=0.8, grid_charge_limit=3.0)
     # Simule une batterie de 10 kWh avec un rendement de 90%, un SoC initial de 50%,
     # interdit l'export vers le réseau
-    simulated = simulate_battery(data, batt_kwh=10, eff=0.9, initial_soc=0.5, allow_export=False)
+    simulated = simulate_battery(pv, load, dates, batt_kwh=10, eff=0.9, initial_soc=0.5, allow_export=False)
     # Simule une batterie de 0 kWh (pas de batterie), pour obtenir import/export sans batterie
-    simulated = simulate_battery(data, batt_kwh=0, eff=0.9, initial_soc=0.5)
+    simulated = simulate_battery(pv, load, dates, batt_kwh=0, eff=0.9, initial_soc=0.5)
     -------------------------------------------------------------------------------------------
     """
     # Validation des paramètres
@@ -696,158 +1099,118 @@ def simulate_battery(rows,
         raise ValueError("Si grid_charge est True, grid_hours doit être une liste d'entiers entre 0 et 23")
     if grid_charge and grid_charge_limit <= 0:
         raise ValueError("Si grid_charge est True, grid_charge_limit doit être > 0")
-    if not rows:
-        return []
-    if not all(isinstance(r, dict) and "date" in r and "pv" in r and "load" in r for r in rows):
-        raise ValueError("rows doit être une liste de dictionnaires contenant au minimum 'date', 'pv' et 'load'")
-
-    # Si pas de batterie, on calcule juste import/export sans batterie
+    pv_arr = np.asarray(pv_arr, dtype=np.float64)
+    load_arr = np.asarray(load_arr, dtype=np.float64)
+    n = len(pv_arr)
+    if len(load_arr) != n or len(dates) != n:
+        raise ValueError("pv_arr, load_arr et dates doivent avoir la même longueur")
+    if hc_mask is not None and len(hc_mask) != n:
+        raise ValueError("hc_mask doit avoir la même longueur que dates")
+
+    # sans batterie et sans détail : statistiques directes, aucune colonne horaire
+    if not return_detail and batt_kwh <= 0:
+        return _no_battery_stats(pv_arr * pv_factor, load_arr)
+    # Sortie préallouée en colonnes contiguës (une par champ), seulement si elle sert :
+    # en mode statistiques avec batterie, le noyau ne renvoie que des totaux
+    if return_detail or batt_kwh <= 0 or n == 0:
+        out = {k: np.zeros(n) for k in SIM_FIELDS}
+        # PV mise à l'échelle (x * 1.0 == x) : pas de tableau intermédiaire par facteur
+        out["pv"] = pv_arr * pv_factor
+        out["load"] = load_arr.copy()
+    if n == 0:
+        return out if return_detail else compute_stats(out)
+
+    # Si pas de batterie, on calcule juste import/export sans batterie :
+    # pas de dépendance entre heures, donc quelques opérations vectorisées
     if batt_kwh <= 0:
-        out=[]
-        for r in rows:
-            pv, ld = float(r["pv"]), float(r["load"])
-            pv_direct = min(pv, ld)
-            export = max(0.0, pv - pv_direct)
-            imp = max(0.0, ld - pv_direct)
-            out.append({
-                "date": r["date"], 
-                "pv": pv, 
-                "load": ld,
-                "export": export, 
-                "import": imp, 
-                "soc": 0.0,
-                "pv_direct": pv_direct, 
-                "batt_to_load": 0.0, 
-                "pv_to_batt": 0.0
-            })
-        return out
+        pv_direct = np.minimum(out["pv"], load_arr)
+        out["pv_direct"] = pv_direct
+        out["export"] = np.maximum(out["pv"] - pv_direct, 0.0)
+        out["import"] = np.maximum(load_arr - pv_direct, 0.0)
+        return out if return_detail else compute_stats(out)
     # Initialisation
-    grid_hours = set(grid_hours or [])
     soc_min = batt_kwh * max(0.0, min(1.0, soc_reserve))
     soc_max = batt_kwh
     soc = batt_kwh * max(0.0, min(1.0, initial_soc))
-    # Simulation horaire
-    out=[]
-    for r in rows:
-        pv = float(r["pv"])
-        load = float(r["load"])
-        # 0) Déterminer si on est en HC (local)
-        hour_local = _hour_from_iso(r["date"])
-        # Si l'heure ne peut être déterminée, on considère que ce n'est pas HC
-        allow_charge_in_hc = grid_charge and (hour_local in grid_hours)
-        in_hc = hour_local in grid_hours if hour_local >= 0 else False
-
-        available_pv = pv
-        remaining_load = load
-        
-        pv_direct      = 0.0
-        pv_to_batt     = 0.0
-        batt_to_load   = 0.0
-        imp_load       = 0.0
-        imp_grid       = 0.0
-        
-        # 1) PV → charges direct
-        pv_direct = min(available_pv, remaining_load)
-        available_pv   -= pv_direct
-        remaining_load -= pv_direct
-
-        # 2) PV -> batterie (stockage) limité par capacité restante + limite horaire
-        pv_in_limit = available_pv if charge_limit is None else min(available_pv, charge_limit)
-        # énergie pouvant être stockée côté batterie
-        can_store_in = (soc_max - soc) / (eff if eff > 0 else 1.0)  # kWh côté entrée PV
-        # énergie effectivement stockée côté PV
-        pv_to_batt = min(pv_in_limit, max(0.0, can_store_in))
-        # Charge effective côté batterie = pv_to_batt * eff
-        if pv_to_batt > 0:
-            soc += pv_to_batt * eff
-            available_pv -= pv_to_batt
-
-        # 3) Batterie -> load (décharge), y compris en HC si autorisée
-        #    Par défaut : en HC, bloquée si allow_discharge_in_hc=False
-        #    Cas particulier demandé : si on RECHARGE via réseau juste après,
-        #    on bloque aussi la décharge pour cette heure (priorité à la recharge)
-        batt_out_limit = remaining_load if discharge_limit is None else min(remaining_load, discharge_limit)
-        # provisoire, sera raffiné après charge réseau
-        if not allow_charge_in_hc and allow_discharge_in_hc or not in_hc:
-            can_discharge_now = True
-        else:
-            can_discharge_now = False
-        if batt_out_limit > 0 and can_discharge_now:
-            # énergie disponible pour décharge côté batterie
-            batt_can_out = max(0.0, soc - soc_min) # kWh *côté batterie*
-            # énergie restituée au load = retiré_du_SoC * eff
-            batt_to_load = min(batt_out_limit, batt_can_out * eff)
-            # mise à jour SoC
-            if batt_to_load > 0:
-                # côté batterie, il faut retirer plus pour compenser le rendement
-                soc -= batt_to_load / (eff if eff > 0 else 1.0)
-                # mise à jour load restant
-                remaining_load -= batt_to_load
-
-        # 4) Le reste du load est à importer
-        imp_load = max(0.0, remaining_load)
-
-        # 5) Surplus PV restant = export si autorisé
-        if allow_export:
-            export = max(0.0, available_pv)
-        else:
-            # forcer l'export à 0 : le surplus PV non utilisé est perdu
-            export = 0.0
-        
-        # 6) Charge réseau en HC pour atteindre la cible (séparée du load)
-        imp_grid = 0.0
-        # Prioriser la recharge réseau uniquement si on est en HC
-        # et si la cible est supérieure au SoC actuel
-        if allow_charge_in_hc:
-            # déterminer la cible de SoC côté batterie
-            target_soc = batt_kwh * max(0.0, min(1.0, grid_target_soc))
-            # ne recharger que si la cible est supérieure au SoC actuel
-            if soc < target_soc:
-                # énergie nécessaire pour atteindre la cible côté batterie
-                need_batt_side = target_soc - soc                              # kWh côté batterie
-                # énergie nécessaire côté réseau (avant rendement)
-                grid_in = min(need_batt_side / (eff if eff > 0 else 1.0),      # kWh côté réseau
-                              max(0.0, grid_charge_limit))
-                # limiter à la capacité restante côté batterie
-                if grid_in > 0:
-                    soc += grid_in * eff
-                    imp_grid += grid_in
-                    
-                    # Prioriser la recharge : interdire la décharge si elle a eu lieu.
-                    # On "annule" toute décharge de l'heure (pas de charge/décharge simultanée).
-                    if batt_to_load > 0:
-                        # remettre le SoC comme s'il n'y avait pas eu de décharge
-                        soc += batt_to_load / (eff if eff > 0 else 1.0)
-                        # remettre le load restant comme s'il n'y avait pas eu de décharge
-                        remaining_load += batt_to_load
-                        # annuler la décharge
-                        batt_to_load = 0.0
-                        # le load restant devient de l'import
-                        imp_load += remaining_load
-                        remaining_load = 0.0
+    # Simulation horaire (noyau compilé si numba est disponible)
+    kernel, jitted = _get_sim_kernel()
+    hc_arr = _hc_mask(dates, grid_hours) if hc_mask is None else np.asarray(hc_mask, dtype=np.bool_)
+    # entrées en floats Python sans numba : pas de scalaire numpy dans la boucle
+    if return_detail:
+        cols = [out[k] for k in ("export", "import", "soc", "pv_direct",
+                                 "batt_to_load", "pv_to_batt", "imp_grid", "imp_load")]
+    else:
+        cols = [np.empty(0)] * 8  # non remplies (store=False)
+    totals = kernel(pv_arr if jitted else pv_arr.tolist(),
+                    load_arr if jitted else load_arr.tolist(),
+                    hc_arr if jitted else hc_arr.tolist(),
+                    float(pv_factor),
+                    float(batt_kwh),
+                    float(eff),
+                    soc_min,
+                    soc_max,
+                    soc,
+                    math.inf if charge_limit is None else float(charge_limit),
+                    math.inf if discharge_limit is None else float(discharge_limit),
+                    grid_charge,
+                    float(grid_target_soc),
+                    float(grid_charge_limit),
+                    allow_discharge_in_hc,
+                    bool(allow_export),
+                    bool(return_detail),
+                    *cols)
+    if not return_detail:
+        return _stats_from_totals(*totals)
+    return out
 
-        # 7) Clamp SoC
-        soc = max(soc_min, min(soc_max, soc))
+def load_hourly_csv(csv_path: str) -> tuple:
+    """
+    Charge le CSV horaire produit par report en colonnes (dates, pv, load).
+    1) copie binaire `<csv>.npz` écrite par report, si l'empreinte (taille, mtime ns)
+       qu'elle contient correspond exactement au CSV actuel
+    2) sinon parseur C de pandas si disponible (`float_precision="round_trip"` :
+       mêmes floats qu'un `float()` Python)
+    3) sinon module csv
 
-        # 8) Import total = load + recharge HC
-        #    Export total = surplus PV
-        #    (la batterie est un tampon interne)
-        imp = imp_load + imp_grid
+    Args:
+        csv_path (str): chemin du CSV horaire (colonnes date, pv_diff, load_diff)
+    Returns:
+        tuple: (dates: list[str], pv_arr: np.ndarray, load_arr: np.ndarray)
+    Raises:
+        KeyError / ValueError: si les colonnes attendues sont absentes ou invalides
+    """
+    npz_path = csv_path + ".npz"
+    try:
+        st = os.stat(csv_path)
+        with np.load(npz_path, allow_pickle=False) as z:
+            if z["csv_stat"].tolist() == [st.st_size, st.st_mtime_ns]:
+                return z["dates"].tolist(), z["pv"], z["load"]
+    except Exception:
+        pass  # absente, périmée, tronquée ou illisible : on relit le CSV
 
-        out.append({
-            "date": r["date"],
-            "pv": pv,
-            "load": load,
-            "export": export,
-            "import": imp_load + imp_grid,
-            "soc": soc,
-            "pv_direct": pv_direct,
-            "batt_to_load": batt_to_load,
-            "pv_to_batt": pv_to_batt,
-            "imp_grid": imp_grid,
-            "imp_load": imp_load,
-        })
-    return out
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None:
+        df = pd.read_csv(csv_path,
+                         usecols=["date", "pv_diff", "load_diff"],
+                         dtype={"date": str, "pv_diff": "float64", "load_diff": "float64"},
+                         engine="c",
+                         float_precision="round_trip")
+        return (df["date"].tolist(),
+                df["pv_diff"].to_numpy(dtype=np.float64),
+                df["load_diff"].to_numpy(dtype=np.float64))
+
+    dates, pv_l, load_l = [], [], []
+    with open(csv_path) as f:
+        rdr = csv.DictReader(f)
+        for r in rdr:
+            dates.append(r["date"])
+            pv_l.append(float(r["pv_diff"]))
+            load_l.append(float(r["load_diff"]))
+    return dates, np.array(pv_l, dtype=np.float64), np.array(load_l, dtype=np.float64)
 
 
 def run_simu(cfg: dict,
@@ -885,55 +1248,10 @@ def run_simu(cfg: dict,
         raise ValueError("Les paramètres 'START' et 'END' doivent être fournis dans la config")
     if not cfg.get("PV_ACTUAL_KW"):
         raise ValueError("Le paramètre 'PV_ACTUAL_KW' doit être fourni dans la config")
-    if cfg["PV_ACTUAL_KW"] <= 0:
-        raise ValueError("Le paramètre 'PV_ACTUAL_KW' doit être > 0")
-    if cfg["TARGET_AC_MIN"] < 0 or cfg["TARGET_AC_MIN"] > 100:
-        raise ValueError("Le paramètre 'TARGET_AC_MIN' doit être dans [0,100]")
-    if cfg["TARGET_AC_MAX"] < 0 or cfg["TARGET_AC_MAX"] > 100:
-        raise ValueError("Le paramètre 'TARGET_AC_MAX' doit être dans [0,100]")
-    if cfg["TARGET_AC_MIN"] > cfg["TARGET_AC_MAX"]:
-        raise ValueError("Le paramètre 'TARGET_AC_MIN' doit être ≤ 'TARGET_AC_MAX'")
-    if cfg["TARGET_TC_MIN"] < 0 or cfg["TARGET_TC_MIN"] > 100:
-        raise ValueError("Le paramètre 'TARGET_TC_MIN' doit être dans [0,100]")
-    if cfg["BATTERY_EFF"] <= 0 or cfg["BATTERY_EFF"] > 1:
-        raise ValueError("Le paramètre 'BATTERY_EFF' doit être dans (0,1]")
-    if not cfg["BATTERY_SIZES"]:
-        raise ValueError("Le paramètre 'BATTERY_SIZES' doit contenir au moins une valeur")
-    if not cfg["PV_FACTORS"]:
-        raise ValueError("Le paramètre 'PV_FACTORS' doit contenir au moins une valeur")
-    if cfg["INITIAL_SOC"] < 0 or cfg["INITIAL_SOC"] > 1:
-        raise ValueError("Le paramètre 'INITIAL_SOC' doit être dans [0,1]")
-    if cfg["BATT_MIN_SOC"] < 0 or cfg["BATT_MIN_SOC"] > 1:
-        raise ValueError("Le paramètre 'BATT_MIN_SOC' doit être dans [0,1]")
-    if cfg["BATT_MIN_SOC"] >= 1.0:
-        raise ValueError("Le paramètre 'BATT_MIN_SOC' doit être < 1.0")
-    if cfg["BATT_MIN_SOC"] >= cfg["INITIAL_SOC"]:
-        raise ValueError("Le paramètre 'BATT_MIN_SOC' doit être < 'INITIAL_SOC'")
-    if cfg.get("MAX_DISCHARGE_KW_PER_HOUR", 0.0) is not None and cfg["MAX_DISCHARGE_KW_PER_HOUR"] <= 0:
-        raise ValueError("Le paramètre 'MAX_DISCHARGE_KW_PER_HOUR' doit être > 0")
-    if not isinstance(cfg.get("ALLOW_DISCHARGE_IN_HC", False), bool):
-        raise ValueError("Le paramètre 'ALLOW_DISCHARGE_IN_HC' doit être booléen (true/false)")
-    if not isinstance(cfg.get("GRID_CHARGE_IN_HC", False), bool):  
-        raise ValueError("Le paramètre 'GRID_CHARGE_IN_HC' doit être booléen (true/false)")
-    if not isinstance(cfg.get("GRID_HOURS", []), list) or not all(isinstance(h,int) and 0<=h<=23 for h in cfg.get("GRID_HOURS", [])):
-        raise ValueError("Le paramètre 'GRID_HOURS' doit être une liste d'entiers entre 0 et 23")
-    if cfg.get("GRID_TARGET_SOC", 0.8) < 0 or cfg.get("GRID_TARGET_SOC", 0.8) > 1:
-        raise ValueError("Le paramètre 'GRID_TARGET_SOC' doit être dans [0,1]")
-    if cfg.get("GRID_CHARGE_LIMIT", 3.0) <= 0:
-        raise ValueError("Le paramètre 'GRID_CHARGE_LIMIT' doit être > 0")
-    if cfg.get("GRID_TARGET_SOC", 0.8) <= cfg["BATT_MIN_SOC"]:
-        raise ValueError("Le paramètre 'GRID_TARGET_SOC' doit être > 'BATT_MIN_SOC'")
-    if cfg.get("GRID_CHARGE_IN_HC", False) and not cfg.get("GRID_HOURS", []):
-        raise ValueError("Si 'GRID_CHARGE_IN_HC' est true, 'GRID_HOURS' doit contenir au moins une heure")
-    if cfg.get("GRID_CHARGE_IN_HC", False) and cfg.get("GRID_TARGET_SOC", 0.8) < cfg["INITIAL_SOC"]:
-        raise ValueError("Si 'GRID_CHARGE_IN_HC' est true, 'GRID_TARGET_SOC' doit être >= 'INITIAL_SOC'")
-    if not LOCAL_TZ and (not args.source or args.source == "ha_ws"):
-        raise RuntimeError("zoneinfo indisponible : installe Python ≥ 3.9") 
-    if args.source == "ha_ws" and not cfg.get("SSL_VERIFY", False):
-        ssl._create_default_https_context = ssl._create_unverified_context
-        #ui.warning("La vérification SSL est désactivée (SSL_VERIFY=false)")
-    
-    # paramètres courants
+    # bornes et types partagés avec `run_report` (table `_CFG_RULES`)
+    _validate_cfg(cfg)
+
+    # paramètres courants : chaque clé lue une seule fois, contrôles croisés sur ces locaux
     IN_CSV          = cfg["OUT_CSV_DETAIL"]               # on lit le CSV horaire produit par report
     OUT_CSV         = cfg["OUT_CSV_SIMU"]                 # fichier de sortie CSV horaire
     TARGET_AC_MIN   = cfg["TARGET_AC_MIN"]                # cible d'autoconso minimum
@@ -960,31 +1278,30 @@ def run_simu(cfg: dict,
     # paramètres forcés si `--override`
     PV_FACTOR             = float(cfg.get("SIM_SCENARIO", {}).get("PV_FACTOR", 1.0))
     BATTERY_KWH           = float(cfg.get("SIM_SCENARIO", {}).get("BATTERY_KWH", 0.0))
+    OUT_CSV_SIM_DETAIL    = cfg.get("OUT_CSV_SIM_DETAIL", "ha_energy_sim_detail.csv")
+
+    if TARGET_AC_MIN > TARGET_AC_MAX:
+        raise ValueError("Le paramètre 'TARGET_AC_MIN' doit être ≤ 'TARGET_AC_MAX'")
+    if BATT_MIN_SOC >= INITIAL_SOC:
+        raise ValueError("Le paramètre 'BATT_MIN_SOC' doit être < 'INITIAL_SOC'")
+    if GRID_TARGET_SOC <= BATT_MIN_SOC:
+        raise ValueError("Le paramètre 'GRID_TARGET_SOC' doit être > 'BATT_MIN_SOC'")
+    if GRID_CHARGE_IN_HC and not GRID_HOURS:
+        raise ValueError("Si 'GRID_CHARGE_IN_HC' est true, 'GRID_HOURS' doit contenir au moins une heure")
+    if GRID_CHARGE_IN_HC and GRID_TARGET_SOC < INITIAL_SOC:
+        raise ValueError("Si 'GRID_CHARGE_IN_HC' est true, 'GRID_TARGET_SOC' doit être >= 'INITIAL_SOC'")
 
     if not Path(IN_CSV).exists():
         print(f"[ERREUR] Fichier horaire introuvable: {IN_CSV}\nLance d'abord --mode report.")
         sys.exit(1)
 
-    # charge data horaire
-    rows=[]
-    with open(IN_CSV) as f:
-        rdr = csv.DictReader(f)
-        for r in rdr:
-            rows.append({"date": r["date"], "pv": float(r["pv_diff"]), "load": float(r["load_diff"])})
-
-    # situation actuelle sans batterie
-    base_no_batt = simulate_battery(
-        rows=rows,
-        grid_hours=[0,1,2,3,4,5,22,23],
-        batt_kwh=0.0,               # pas de batterie
-        eff=EFF,                    # pas utilisé mais requis
-        soc_reserve=0.0,            # SoC ignoré
-        initial_soc=0.0,            # SoC ignoré
-        discharge_limit=None,       # SoC ignoré
-        allow_discharge_in_hc=False, # Pas de batterie
-        allow_export=True,          # export autorisé
-    )
-    base_stats = compute_stats(base_no_batt)
+    # charge data horaire en colonnes (dates, pv, load)
+    dates, pv_arr, load_arr = load_hourly_csv(IN_CSV)
+    # heures creuses par heure : ne dépendent que des dates, partagées par toutes les simulations
+    HC_MASK = _hc_mask(dates, GRID_HOURS)
+
+    # situation actuelle sans batterie : statistiques calculées directement sur les colonnes
+    base_stats = _no_battery_stats(pv_arr, load_arr)
 
     # résumé de la situation actuelle
     ui.summary("Situation actuelle",
@@ -1000,8 +1317,6 @@ def run_simu(cfg: dict,
 
     # si override, on force les paramètres
     if args.override:
-        # on applique le facteur PV
-        scaled_rows = simulate_pv_scale(rows, PV_FACTOR)
         # vérifications
         if PV_FACTOR <= 0:
             raise ValueError(f"Le paramètre forcé PV_FACTOR doit être > 0 (actuel: {PV_FACTOR})")
@@ -1013,8 +1328,12 @@ def run_simu(cfg: dict,
             raise ValueError(f"Le paramètre 'BATT_MIN_SOC' doit être < 'INITIAL_SOC' (actuel: {BATT_MIN_SOC} >= {INITIAL_SOC})")
         # simulation
         sim = simulate_battery(
-            rows=scaled_rows,
+            pv_arr=pv_arr,
+            load_arr=load_arr,
+            dates=dates,
+            pv_factor=PV_FACTOR,                            # facteur PV forcé
             grid_hours=GRID_HOURS,                          # Heures creuses
+            hc_mask=HC_MASK,                                # masque HC pré-calculé
             batt_kwh=BATTERY_KWH,                           # batterie utilisée
             eff=EFF,                                        # Batterie efficiency
             soc_reserve=BATT_MIN_SOC,                       # minimum de capacité pour la batterie
@@ -1028,9 +1347,7 @@ def run_simu(cfg: dict,
             charge_limit=PV_CHARGE_LIMIT                    # limite de charge PV (None = illimité)
         )
 
-        #pprint(sim)
         # stats et résumé
-        daily = aggregate_daily(sim)
         st  = compute_stats(sim)
         ui.summary(f"Simulation forcée (override) PV x{PV_FACTOR:g}, Batt {int(BATTERY_KWH)} kWh, Export : {'Oui' if ALLOW_EXPORT else 'Non'}",
                      st["pv_tot"],
@@ -1044,29 +1361,38 @@ def run_simu(cfg: dict,
                      pv_factor=PV_FACTOR,
                      batt_kw=BATTERY_KWH)
         # CSV détaillé
-        csv_detail_path = cfg.get("OUT_CSV_SIM_DETAIL", "ha_energy_sim_detail.csv")
+        csv_detail_path = OUT_CSV_SIM_DETAIL
         context = {
             "pv_factor": PV_FACTOR,       # facteur du scénario retenu
             "batt_kwh": BATTERY_KWH,      # capacité batterie
             "eff": EFF,
             "initial_soc": cfg.get("INITIAL_SOC", 0.0),
-            "pv_kwc": cfg.get("PV_ACTUAL_KW", 0.0),
+            "pv_kwc": PV_ACTUAL_KW,
             "scenario": f"PV x{PV_FACTOR:g}, Batt {int(BATTERY_KWH)} kWh",
         }
-        save_sim_detail(csv_detail_path, sim, context=context)
+        save_sim_detail(csv_detail_path, sim, dates, context=context)
         ui.definitions()
         return
     # sinon on teste toutes les combinaisons
-    results=[]
-    for fct in PV_FACTORS:
-        # on applique le facteur PV
-        scaled = simulate_pv_scale(rows, fct)
+    def _sweep_factor(fct: float) -> list:
+        """ Simule toutes les tailles de batterie pour un facteur PV donné.
+
+        Args:
+            fct (float): facteur PV
+        Returns:
+            list: [(fct, batt_kwh, stats), ...] dans l'ordre de BATTERY_SIZES
+        """
+        res = []
         # pour chaque taille de batterie
         for batt_kwh in BATTERY_SIZES:
-            # simulation
-            sim = simulate_battery(
-                rows=scaled,
+            # simulation : statistiques globales seulement (pas de colonnes horaires)
+            st = simulate_battery(
+                pv_arr=pv_arr,
+                load_arr=load_arr,
+                dates=dates,
+                pv_factor=fct,                                  # facteur PV appliqué dans le noyau
                 grid_hours=GRID_HOURS,                          # Heures creuses
+                hc_mask=HC_MASK,                                # masque HC pré-calculé
                 batt_kwh=batt_kwh,                              # batterie utilisée
                 eff=EFF,                                        # Batterie efficiency
                 soc_reserve=BATT_MIN_SOC,                       # minimum de capacité pour la batterie
@@ -1077,29 +1403,41 @@ def run_simu(cfg: dict,
                 grid_target_soc=GRID_TARGET_SOC,                # cible de SoC en HC
                 grid_charge_limit=GRID_CHARGE_LIMIT,            # limite de charge en HC
                 allow_export=ALLOW_EXPORT,                      # autorise ou non l'export vers le réseau
-                charge_limit=PV_CHARGE_LIMIT                    # limite de charge PV (None = illimité)
+                charge_limit=PV_CHARGE_LIMIT,                   # limite de charge PV (None = illimité)
+                return_detail=False,                            # totaux cumulés dans le noyau
             )
-            # stats
-            daily = aggregate_daily(sim)
-            # stats globales
-            st  = compute_stats(sim)
-            results.append((fct, batt_kwh, st))
+            res.append((fct, batt_kwh, st))
+        return res
+
+    # les facteurs sont indépendants : en parallèle si le noyau compilé libère le GIL,
+    # séquentiel sinon (la boucle Python garde le GIL, les threads n'apporteraient rien)
+    _, jitted = _get_sim_kernel()
+    if jitted and len(PV_FACTORS) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(PV_FACTORS), os.cpu_count() or 1)) as ex:
+            per_factor = list(ex.map(_sweep_factor, PV_FACTORS))
+    else:
+        per_factor = [_sweep_factor(fct) for fct in PV_FACTORS]
+    # ordre conservé : facteur puis taille de batterie
+    results = [item for res in per_factor for item in res]
 
-    with open(OUT_CSV, "w", newline="") as f:
+    with open(OUT_CSV, "w", newline="", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(["pv_factor","battery_kWh","pv_tot_kWh","load_tot_kWh","import_kWh","export_kWh","AC_%","TC_%"])
-        for fct, b, st in results:
-            w.writerow([fct, 
-                        b, 
-                        st["pv_tot"], 
-                        st["load_tot"], 
-                        st["import_tot"], 
-                        st["export_tot"], 
-                        st["ac"], 
-                        st["tc"]])
+        w.writerows((fct,
+                     b,
+                     st["pv_tot"],
+                     st["load_tot"],
+                     st["import_tot"],
+                     st["export_tot"],
+                     st["ac"],
+                     st["tc"]) for fct, b, st in results)
 
     # filtre les résultats qui passent les cibles
-    passing = [(fct,b,st) for (fct,b,st) in results if (TARGET_AC_MIN <= st["ac"] <= TARGET_AC_MAX) and (st["tc"] >= TARGET_TC_MIN)]
+    # seuls les PASSING_LIMIT premiers scénarios valides sont retenus/affichés :
+    # le filtre s'arrête dès qu'ils sont trouvés (ordre du balayage conservé, pas de tri)
+    passing = list(islice(((fct,b,st) for (fct,b,st) in results
+                           if (TARGET_AC_MIN <= st["ac"] <= TARGET_AC_MAX) and (st["tc"] >= TARGET_TC_MIN)),
+                          PASSING_LIMIT))
     if passing:
         # on prend le premier qui passe (ou trie si tu veux un critère)
         pv_factor, batt_kwh, st = passing[0]
@@ -1107,15 +1445,14 @@ def run_simu(cfg: dict,
         ui.show_no_scenarios(TARGET_AC_MIN, TARGET_AC_MAX, TARGET_TC_MIN)
         sys.exit(1)
 
-    # applique le facteur PV aux rows (copie légère)
-    scaled_rows = [
-        {"date": r["date"], "pv": float(r["pv"]) * pv_factor, "load": float(r["load"])}
-        for r in rows
-    ]
     # simule une dernière fois pour avoir les détails horaires
     sim = simulate_battery(
-        rows=scaled_rows,
+        pv_arr=pv_arr,
+        load_arr=load_arr,
+        dates=dates,
+        pv_factor=pv_factor,                            # facteur PV retenu
         grid_hours=GRID_HOURS,                          # Heures creuses
+        hc_mask=HC_MASK,                                # masque HC pré-calculé
         batt_kwh=batt_kwh,                              # batterie utilisée
         eff=EFF,                                        # Batterie efficiency
         soc_reserve=BATT_MIN_SOC,                       # minimum de capacité pour la batterie
@@ -1129,30 +1466,55 @@ def run_simu(cfg: dict,
         charge_limit=PV_CHARGE_LIMIT                    # limite de charge PV (None = illimité)
     )
     # chemin de sortie configurable (ajoute la clé dans ton JSON)
-    csv_detail_path = cfg.get("OUT_CSV_SIM_DETAIL", "ha_energy_sim_detail.csv")
+    csv_detail_path = OUT_CSV_SIM_DETAIL
     context = {
         "pv_factor": pv_factor,           # facteur du scénario retenu
         "batt_kwh": batt_kwh,
         "eff": EFF,
         "initial_soc": cfg.get("INITIAL_SOC", 0.0),
-        "pv_kwc": cfg.get("PV_ACTUAL_KW", 0.0),
+        "pv_kwc": PV_ACTUAL_KW,
         "scenario": f"PV x{pv_factor:g}, Batt {int(batt_kwh)} kWh",
     }
     # CSV détaillé
-    save_sim_detail(csv_detail_path, sim, context=context)
+    save_sim_detail(csv_detail_path, sim, dates, context=context)
     
     # Affichage
-    ui.passing(passing, TARGET_AC_MIN, TARGET_AC_MAX, TARGET_TC_MIN, limit=10)
+    ui.passing(passing, TARGET_AC_MIN, TARGET_AC_MAX, TARGET_TC_MIN, limit=PASSING_LIMIT)
     if passing:
         # déjà triés : passer passing[0]
-        ui.best(passing[0], cfg["PV_ACTUAL_KW"])
+        ui.best(passing[0], PV_ACTUAL_KW)
 
     ui.definitions()
 
+# jours présents par fichier CSV : (chemin, mtime_ns, taille) -> (liste triée, frozenset)
+# un fichier réécrit change de clé, l'ancienne entrée n'est plus jamais lue
+_DAYS_CACHE: dict[tuple, tuple] = {}
+
+def _csv_days_index(csv_path: str) -> tuple:
+    """
+    Jours présents dans le CSV, lus une seule fois par version du fichier (cf. `_DAYS_CACHE`).
+
+    Args:
+        csv_path (str): chemin du CSV
+    Returns:
+        tuple: (list[str] triée, frozenset[str]) des jours présents
+    """
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return [], frozenset()
+    key = (str(csv_path), st.st_mtime_ns, st.st_size)
+    hit = _DAYS_CACHE.get(key)
+    if hit is None:
+        days = _scan_csv_days(csv_path)
+        hit = _DAYS_CACHE[key] = (days, frozenset(days))
+    return hit
+
 def csv_available_days(csv_path: str) -> list[str]:
     """
     Retourne la liste triée des jours (YYYY-MM-DD) présents dans le CSV "detail".
     On lit la colonne 'date' et on tronque à 10 caractères.
+    Le fichier n'est relu que s'il a changé depuis le dernier appel.
 
     Args:
         csv_path (str): chemin du CSV
@@ -1161,14 +1523,53 @@ def csv_available_days(csv_path: str) -> list[str]:
     Raises:
         None
     """
+    return list(_csv_days_index(csv_path)[0])
+
+# taille à partir de laquelle la colonne 'date' est lue par pandas (par blocs) :
+# en dessous, le coût d'import de pandas dépasse le gain du parseur C
+_DAYS_PANDAS_MIN_BYTES = 8 << 20
+
+def _scan_csv_days(csv_path: str) -> list[str]:
+    """
+    Parcourt la colonne 'date' du CSV et renvoie les jours (YYYY-MM-DD) triés.
+    Gros fichiers : parseur C de pandas sur la seule colonne 'date', par blocs de 200 000 lignes
+    (mémoire bornée). Sinon, ou si pandas est absent / échoue : module csv.
+
+    Args:
+        csv_path (str): chemin du CSV
+    Returns:
+        list[str]: jours présents (liste vide si le fichier est illisible ou sans colonne 'date')
+    """
     days = set()
+    try:
+        big = os.path.getsize(csv_path) >= _DAYS_PANDAS_MIN_BYTES
+    except OSError:
+        return []
+    if big:
+        try:
+            import pandas as pd
+            for chunk in pd.read_csv(csv_path, usecols=["date"], dtype={"date": str},
+                                     chunksize=200_000, engine="c"):
+                ts = chunk["date"].dropna().str.slice(0, 10)
+                # même contrôle que ligne à ligne : 10 caractères, '-' en 4 et 7
+                ok = (ts.str.len() == 10) & (ts.str[4] == "-") & (ts.str[7] == "-")
+                days.update(ts[ok].unique())
+            return sorted(days)
+        except Exception:
+            days = set()  # pandas absent ou CSV irrégulier : lecture ligne à ligne
     try:
         with open(csv_path, "r", newline="") as f:
-            rdr = csv.DictReader(f)
+            rdr = csv.reader(f)
+            header = next(rdr, [])
+            if "date" not in header:
+                return []
+            # accès positionnel : pas de dict par ligne ni de str() sur la valeur
+            i_date = header.index("date")
             for r in rdr:
-                ts = str(r.get("date",""))[:10]
-                if len(ts) == 10 and ts[4] == "-" and ts[7] == "-":
-                    days.add(ts)
+                if i_date < len(r):
+                    ts = r[i_date][:10]
+                    if len(ts) == 10 and ts[4] == "-" and ts[7] == "-":
+                        days.add(ts)
     except Exception:
         pass
     return sorted(days)
@@ -1187,7 +1588,7 @@ def csv_has_day(csv_path: str,
     Raises:
         None
     """
-    return day in set(csv_available_days(csv_path))
+    return day in _csv_days_index(csv_path)[1]
 
 def run_plot(cfg: dict,
              args=None,